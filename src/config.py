@@ -1,8 +1,22 @@
 import os
+import copy
 import json
+import hashlib
+import orjson
 import yaml
 import logging
-from jsonschema import validate, ValidationError
+import tempfile
+from collections import OrderedDict
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 # Define a schema for configuration validation
 CONFIG_SCHEMA = {
@@ -33,10 +47,63 @@ CONFIG_SCHEMA = {
     "required": ["data_directory", "output_directory", "analysis_mode", "file_types", "email_settings"],
 }
 
+def _compile_validator(schema):
+    """Compile the schema once so validation does not rebuild it on every load."""
+    if fastjsonschema is not None:
+        validate = fastjsonschema.compile(schema)
+
+        def check(instance):
+            try:
+                validate(instance)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(e.message)
+        return check
+
+    from jsonschema import ValidationError
+    from jsonschema.validators import validator_for
+
+    validator = validator_for(schema)(schema)
+
+    def check(instance):
+        try:
+            validator.validate(instance)
+        except ValidationError as e:
+            raise ValueError(e.message)
+    return check
+
+_VALIDATE = _compile_validator(CONFIG_SCHEMA)
+
+# Parsed config files keyed by path, holding (mtime, size, settings)
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_SIZE = 100
+
+def _has_only_str_keys(tree):
+    """Check that every mapping in a loaded YAML tree has string keys, so it round-trips through JSON."""
+    if isinstance(tree, dict):
+        return all(isinstance(key, str) and _has_only_str_keys(value) for key, value in tree.items())
+    if isinstance(tree, list):
+        return all(_has_only_str_keys(item) for item in tree)
+    return True
+
+def _deep_update(target, updates):
+    """Merge updates into target in place, descending into nested dictionaries."""
+    for key, value in updates.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _deep_update(current, value)
+        else:
+            target[key] = value
+
+# Settings exposed as plain attributes once the configuration has been validated
+_TYPED_SETTINGS = ('data_directory', 'output_directory', 'analysis_mode', 'file_types', 'email_settings')
+
 class Config:
+    __slots__ = ('config_files', 'settings', 'validated_digest') + _TYPED_SETTINGS
+
     def __init__(self, config_files=['config.json']):
         self.config_files = config_files
         self.settings = {}
+        self.validated_digest = None
         self.load_config()
 
     def load_config(self):
@@ -47,16 +114,11 @@ class Config:
                 continue
 
             try:
-                if config_file.endswith('.json'):
-                    with open(config_file, 'r') as f:
-                        new_settings = json.load(f)
-                elif config_file.endswith('.yaml') or config_file.endswith('.yml'):
-                    with open(config_file, 'r') as f:
-                        new_settings = yaml.safe_load(f)
-                else:
+                new_settings = self.parse_config_file(config_file)
+                if new_settings is None:
                     logging.error("Unsupported configuration file format. Use JSON or YAML.")
                     continue
-                
+
                 # Merge new settings with existing settings
                 self.merge_settings(new_settings)
 
@@ -69,9 +131,63 @@ class Config:
         # Load sensitive data from environment variables
         self.load_sensitive_data_from_env()
 
+    def parse_config_file(self, config_file):
+        """Parse a single config file, reusing the cached result if it is unchanged."""
+        st = os.stat(config_file)
+        entry = _PARSE_CACHE.get(config_file)
+        if entry and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            _PARSE_CACHE.move_to_end(config_file)
+            return copy.deepcopy(entry[2])
+
+        if config_file.endswith('.json'):
+            with open(config_file, 'r') as f:
+                new_settings = json.load(f)
+        elif config_file.endswith('.yaml') or config_file.endswith('.yml'):
+            new_settings = self.load_yaml_with_cache(config_file)
+        else:
+            return None
+
+        _PARSE_CACHE[config_file] = (st.st_mtime, st.st_size, copy.deepcopy(new_settings))
+        _PARSE_CACHE.move_to_end(config_file)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+        return new_settings
+
+    def load_yaml_with_cache(self, config_file):
+        """Load a YAML file, preferring its JSON sibling cache when that is up to date."""
+        cache_file = f"{config_file}.cache.json"
+        if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= os.path.getmtime(config_file):
+            try:
+                with open(cache_file, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable config cache '{cache_file}': {e}")
+
+        with open(config_file, 'r') as f:
+            new_settings = yaml.load(f, Loader=_YamlLoader)
+
+        # JSON turns int, bool and null keys into strings, so such trees are not cached
+        if not _has_only_str_keys(new_settings):
+            logging.debug(f"Not caching '{config_file}': it has non-string keys")
+            return new_settings
+
+        # Write the cache atomically so a concurrent reader never sees a partial file
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile('w', dir=os.path.dirname(os.path.abspath(config_file)),
+                                             suffix='.tmp', delete=False) as tmp:
+                tmp_name = tmp.name
+                json.dump(new_settings, tmp)
+            os.replace(tmp_name, cache_file)
+        except (OSError, TypeError, ValueError) as e:
+            logging.warning(f"Could not write config cache '{cache_file}': {e}")
+            if tmp_name and os.path.exists(tmp_name):
+                os.remove(tmp_name)
+        return new_settings
+
     def merge_settings(self, new_settings):
         """Merge new settings into the existing settings."""
-        self.settings = {**self.settings, **new_settings}
+        _deep_update(self.settings, new_settings)
 
     def load_sensitive_data_from_env(self):
         """Load sensitive information from environment variables."""
@@ -81,11 +197,25 @@ class Config:
 
     def validate_config(self):
         """Validate the loaded configuration settings against a schema."""
+        digest = self.settings_digest()
+        if digest is None or digest != self.validated_digest:
+            try:
+                _VALIDATE(self.settings)
+            except ValueError as e:
+                logging.error(f"Configuration validation error: {e}")
+                raise ValueError(f"Configuration validation error: {e}")
+            self.validated_digest = digest
+
+        for key in _TYPED_SETTINGS:
+            setattr(self, key, self.settings[key])
+
+    def settings_digest(self):
+        """Hash the merged settings so an unchanged reload can skip validation."""
         try:
-            validate(instance=self.settings, schema=CONFIG_SCHEMA)
-        except ValidationError as e:
-            logging.error(f"Configuration validation error: {e.message}")
-            raise ValueError(f"Configuration validation error: {e.message}")
+            serialized = orjson.dumps(self.settings, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return None  # Not JSON-representable; always validate
+        return hashlib.blake2b(serialized).digest()
 
     def configure_logging(self):
         """Configure logging settings based on the configuration."""
@@ -106,27 +236,29 @@ class Config:
 
     def get_data_directory(self):
         """Get the data directory."""
-        return self.settings['data_directory']
+        return self.data_directory
 
     def get_output_directory(self):
         """Get the output directory."""
-        return self.settings['output_directory']
+        return self.output_directory
 
     def get_analysis_mode(self):
         """Get the analysis mode."""
-        return self.settings['analysis_mode']
+        return self.analysis_mode
 
     def get_file_types(self):
         """Get the list of file types for analysis."""
-        return self.settings['file_types']
+        return self.file_types
 
     def get_email_settings(self):
         """Get email settings for error reporting."""
-        return self.settings['email_settings']
+        return self.email_settings
 
     def add_custom_setting(self, key, value):
         """Add a custom setting dynamically."""
         self.settings[key] = value
+        if key in _TYPED_SETTINGS:
+            setattr(self, key, value)
 
 # Example usage
 if __name__ == "__main__":
@@ -3,8 +3,9 @@ import time
 import logging
 import psutil
 import subprocess
-import json
+import orjson
 import threading
+from collections import OrderedDict, deque
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -15,22 +16,61 @@ import sys
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Repeats of the same event on the same path within this window are dropped
+EVENT_COALESCE_WINDOW_NS = 50_000_000
+# Only the most recent events are kept so a noisy sample cannot exhaust memory
+MAX_FILE_EVENTS = 200_000
+
 class FileChangeHandler(FileSystemEventHandler):
     """Handles file system change events."""
-    def __init__(self, log_list):
-        self.log_list = log_list
+    def __init__(self, max_events=MAX_FILE_EVENTS):
+        # Events are kept column-wise in fixed-size rings; see to_records()
+        self.event_types = deque(maxlen=max_events)
+        self.src_paths = deque(maxlen=max_events)
+        self.timestamps_ns = deque(maxlen=max_events)
+        self.total_events = 0
+        # Last recorded time per (event, path), oldest first; entries past the coalescing window
+        # are pruned so creating millions of distinct files does not grow it without bound
+        self.last_seen = OrderedDict()
+        self.wall_clock_offset_ns = time.time_ns() - time.monotonic_ns()
+
+    def record_event(self, event_type, src_path):
+        """Record an event cheaply, coalescing bursts on the same path."""
+        now = time.monotonic_ns()
+        last_seen = self.last_seen
+        while last_seen and now - next(iter(last_seen.values())) >= EVENT_COALESCE_WINDOW_NS:
+            last_seen.popitem(last=False)
+        key = (event_type, src_path)
+        if key in last_seen:
+            return  # Still within the window, since older entries were just pruned
+        last_seen[key] = now
+        self.event_types.append(event_type)
+        self.src_paths.append(src_path)
+        self.timestamps_ns.append(now)
+        self.total_events += 1
+        logger.debug("File %s: %s", event_type, src_path)
 
     def on_modified(self, event):
-        self.log_list.append({'event': 'modified', 'src_path': event.src_path, 'timestamp': datetime.now().isoformat()})
-        logger.info(f"File modified: {event.src_path}")
+        self.record_event('modified', event.src_path)
 
     def on_created(self, event):
-        self.log_list.append({'event': 'created', 'src_path': event.src_path, 'timestamp': datetime.now().isoformat()})
-        logger.info(f"File created: {event.src_path}")
+        self.record_event('created', event.src_path)
 
     def on_deleted(self, event):
-        self.log_list.append({'event': 'deleted', 'src_path': event.src_path, 'timestamp': datetime.now().isoformat()})
-        logger.info(f"File deleted: {event.src_path}")
+        self.record_event('deleted', event.src_path)
+
+    def to_records(self):
+        """Convert the retained events into dictionaries with ISO timestamps."""
+        logger.info("Recorded %d file change events.", self.total_events)
+        dropped = self.total_events - len(self.event_types)
+        if dropped > 0:
+            logger.warning("Dropped %d oldest file change events (limit %d).", dropped, self.event_types.maxlen)
+        offset = self.wall_clock_offset_ns
+        return [
+            {'event': event_type, 'src_path': src_path,
+             'timestamp': datetime.fromtimestamp((timestamp + offset) / 1e9).isoformat()}
+            for event_type, src_path, timestamp in zip(self.event_types, self.src_paths, self.timestamps_ns)
+        ]
 
 class DynamicAnalyzer:
     def __init__(self, sample_path, timeout=60, env_vars=None):
@@ -46,6 +86,7 @@ class DynamicAnalyzer:
         self.process_tree = []
         self.env_vars = env_vars or {}
         self.observer = None
+        self.file_change_handler = None
 
     def start_analysis(self):
         """Starts the dynamic analysis of the malware sample."""
@@ -85,24 +126,35 @@ class DynamicAnalyzer:
 
     def monitor_process(self, process):
         """Monitors the process and logs its resource usage."""
+        try:
+            # Resolve the process once; the name does not change while it runs
+            proc = psutil.Process(process.pid)
+            name = proc.name()
+            proc.cpu_percent(interval=None)  # Seed the counter so later calls are non-blocking
+        except psutil.Error:
+            return
+
         while True:
+            time.sleep(1)
             if process.poll() is not None:  # Process has finished
                 break
-
-            cpu_usage = psutil.cpu_percent(interval=1)
-            mem_info = psutil.Process(process.pid).memory_info()
+            try:
+                with proc.oneshot():
+                    cpu_usage = proc.cpu_percent(interval=None)
+                    mem_info = proc.memory_info()
+            except psutil.Error:
+                break
 
             logger.info(f"Process ID: {process.pid}, CPU Usage: {cpu_usage}%, Memory Usage: {mem_info.rss / (1024 ** 2):.2f} MB")
-            self.process_tree.append((process.pid, process.name(), datetime.now().isoformat()))
-            time.sleep(1)
+            self.process_tree.append((process.pid, name, datetime.now().isoformat()))
 
     def start_file_monitoring(self):
         """Starts monitoring the file system for changes."""
         self.file_change_logs = []  # Reset file change logs
-        event_handler = FileChangeHandler(self.file_change_logs)
-        self.observer = Observer()
+        self.file_change_handler = FileChangeHandler()
+        self.observer = Observer()  # Resolves to the inotify backend on Linux
         observer_path = os.path.dirname(self.sample_path)  # Monitor the directory of the sample
-        self.observer.schedule(event_handler, path=observer_path, recursive=True)  # Monitor the directory where the sample is located
+        self.observer.schedule(self.file_change_handler, path=observer_path, recursive=True)  # Monitor the directory where the sample is located
         self.observer.start()
         logger.info("Started monitoring file system changes.")
 
@@ -129,7 +181,7 @@ class DynamicAnalyzer:
                 'execution_time': self.end_time - self.start_time,
                 'child_processes': [p.pid for p in process.children()]
             }
-            logger.info(f"Collected process information: {self.process_info}")
+            logger.info("Collected process information: %s", self.process_info)
 
         except Exception as e:
             logger.error(f"Error collecting process info: {e}")
@@ -143,19 +195,21 @@ class DynamicAnalyzer:
                 {"timestamp": "2024-09-26T12:00:05Z", "src_ip": "192.168.1.1", "dst_ip": "93.184.216.34", "bytes_sent": 300}
             ]
             self.network_logs.extend(dummy_network_data)
-            logger.info(f"Collected network logs: {self.network_logs}")
+            logger.info("Collected network logs: %s", self.network_logs)
 
         except Exception as e:
             logger.error(f"Error collecting network logs: {e}")
 
     def collect_file_changes(self):
         """Collects file changes detected during the analysis."""
-        logger.info(f"Collected file changes: {self.file_change_logs}")
+        if self.file_change_handler is not None:
+            self.file_change_logs = self.file_change_handler.to_records()
+        logger.info("Collected file changes: %s", self.file_change_logs)
 
     def collect_registry_changes(self):
         """Collects changes in the registry during the analysis."""
         # This is a placeholder for actual implementation.
-        logger.info(f"Collected registry changes: {self.registry_changes}")
+        logger.info("Collected registry changes: %s", self.registry_changes)
 
     def save_memory_dump(self):
         """Captures and saves memory dump of the process."""
@@ -182,15 +236,15 @@ class DynamicAnalyzer:
         }
 
         try:
-            with open(output_file, 'w') as f:
-                json.dump(results, f, indent=4)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
             logger.info(f"Results saved to {output_file}")
 
         except Exception as e:
             logger.error(f"Error saving results: {e}")
 
 # Example usage
-if __name__ == "__main__":
+def main():
     # Prompt user for the path of the malware sample
     sample_path = input("Enter the path of the malware sample to analyze: ")
     timeout = 60  # You can also prompt the user for this if needed
@@ -198,3 +252,6 @@ if __name__ == "__main__":
     analyzer = DynamicAnalyzer(sample_path=sample_path, timeout=timeout, env_vars=env_variables)
     analyzer.start_analysis()
     analyzer.save_results()
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,85 @@
 import os
 import hashlib
 import pefile
-import json
+import orjson
 import logging
 import binascii
-import math
 import mimetypes
+import mmap
+import threading
+import numpy as np
 import pyclamd  # Import ClamAV library
 from typing import List, Dict
 
+try:
+    import ahocorasick  # Multi-pattern matcher for signature scanning
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+SCAN_CHUNK_SIZE = 1024 * 1024  # Bytes consumed per iteration of the fused scan
+IOC_STRING_SAMPLE_SIZE = 20  # Strings quoted in the IOC log
+HEX_DUMP_BYTES = 500  # Leading bytes included in the hex dump (1000 hex chars)
+
+# Example of a simple signature database (In real scenarios, load from a file or database)
+KNOWN_SIGNATURES = {
+    "malware_signature_1": ["malicious_string_1", "malicious_string_2"],
+    "malware_signature_2": ["malicious_string_3"],
+}
+
+def build_signature_automaton(signatures: Dict[str, List[str]]):
+    """Compile every signature pattern into one Aho-Corasick automaton."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for signature, patterns in signatures.items():
+        for pattern in patterns:
+            names = automaton.get(pattern, ())
+            automaton.add_word(pattern, names + (signature,))
+    automaton.make_automaton()
+    return automaton
+
+_SIGNATURE_AUTOMATON = build_signature_automaton(KNOWN_SIGNATURES)
+
+# ClamAV connection shared by every analyzer, created on first use
+_clamd = None
+_clamd_lock = threading.Lock()
+
+def get_clamd():
+    """Return the shared ClamAV connection, or None if the daemon is not running."""
+    global _clamd
+    with _clamd_lock:
+        if _clamd is None:
+            try:
+                cd = pyclamd.ClamdUnixSocket()
+                if not cd.ping():
+                    return None
+            except (pyclamd.ConnectionError, OSError) as e:
+                # No socket configured or nothing listening on it
+                logger.debug("ClamAV connection failed: %s", e)
+                return None
+            logger.info("ClamAV is running.")
+            _clamd = cd
+        return _clamd
+
+def scan_many(paths: List[str]) -> Dict[str, List[str]]:
+    """Scan several samples over the shared ClamAV connection."""
+    cd = get_clamd()
+    if cd is None:
+        logger.error("ClamAV is not running. Cannot perform scan.")
+        return {}
+    matches = {}
+    for path in paths:
+        scan_result = cd.multiscan_file(os.path.abspath(path))
+        if scan_result:
+            for scanned_path, result in scan_result.items():
+                matches.setdefault(scanned_path, []).append(result[0])
+    logger.info("ClamAV batch scan matched %d of %d samples.", len(matches), len(paths))
+    return matches
+
 class StaticAnalyzer:
     def __init__(self, sample_path: str):
         self.sample_path = sample_path
@@ -25,6 +92,7 @@ class StaticAnalyzer:
             "strings": [],
             "signature_matches": [],
             "entropy": {},
+            "file_entropy": None,
             "api_calls": [],
             "hex_dump": "",
             "ioc_logs": [],
@@ -33,6 +101,10 @@ class StaticAnalyzer:
             "clamav_matches": []
         }
         self.cd = None  # Initialize ClamAV connection
+        self._mmap = None
+        self._data = None  # Shared read-only view of the sample while analyze() runs
+        self._pe = None  # Shared pefile.PE instance, parsed on first use
+        self._stat = None  # os.stat_result captured when the sample is loaded
 
     def analyze(self) -> Dict:
         """Perform static analysis on the provided malware sample."""
@@ -42,23 +114,108 @@ class StaticAnalyzer:
             logger.error(f"File not found: {self.sample_path}")
             return self.analysis_results
 
-        self.analysis_results["file_type"] = self.detect_file_type()
-        self.analysis_results["file_hash"] = self.calculate_file_hash()
-        self.extract_metadata()
-        self.analyze_pe_file()
-        self.analyze_strings()
-        self.match_signatures()
-        self.analyze_entropy()
-        self.extract_api_calls()
-        self.generate_hex_dump()
-        self.log_indicators_of_compromise()
-        self.analyze_binary_size()
-        self.validate_checksum()
-        self.match_clamav_rules()
+        self.load_sample()
+        try:
+            self.analysis_results["file_type"] = self.detect_file_type()
+            self.scan_sample()
+            self.extract_metadata()
+            self.analyze_pe_file()
+            self.match_signatures()
+            self.analyze_entropy()
+            self.extract_api_calls()
+            self.generate_hex_dump()
+            self.log_indicators_of_compromise()
+            self.analyze_binary_size()
+            self.validate_checksum()
+            self.match_clamav_rules()
+        finally:
+            self.release_sample()
 
         logger.info(f"Static analysis completed for {self.sample_path}")
         return self.analysis_results
 
+    def load_sample(self):
+        """Map the sample into memory once so every pass shares the same buffer."""
+        with open(self.sample_path, 'rb') as f:
+            self._stat = os.fstat(f.fileno())
+            if self._stat.st_size == 0:
+                self._data = memoryview(b'')  # Empty files cannot be mapped
+            else:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                self._data = memoryview(self._mmap)
+
+    def release_sample(self):
+        """Release the shared sample buffer."""
+        if self._pe is not None:
+            self._pe.close()
+            self._pe = None
+        if self._data is not None:
+            self._data.release()
+            self._data = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._stat = None
+
+    def get_stat(self) -> os.stat_result:
+        """Return the sample's stat result, reusing the one taken when it was loaded."""
+        return self._stat if self._stat is not None else os.stat(self.sample_path)
+
+    def read_sample(self, size: int = -1):
+        """Return up to size bytes of the sample (all if negative), reusing the shared buffer when loaded."""
+        if self._data is not None:
+            return self._data if size < 0 else self._data[:size]
+        with open(self.sample_path, 'rb') as f:
+            return f.read(size)
+
+    def scan_sample(self, min_length: int = 4):
+        """Hash, extract strings and build the byte histogram in a single pass over the sample."""
+        data = self.read_sample()
+        hasher = hashlib.sha256()
+        counts = np.zeros(256, dtype=np.int64)
+        strings = []
+        carry = b''  # Printable run still open at the end of the previous chunk
+
+        for offset in range(0, len(data), SCAN_CHUNK_SIZE):
+            chunk = data[offset:offset + SCAN_CHUNK_SIZE]
+            hasher.update(chunk)
+            arr = np.frombuffer(chunk, dtype=np.uint8)
+            counts += np.bincount(arr, minlength=256)
+
+            starts, ends = self.find_printable_runs(arr)
+            if carry and (len(starts) == 0 or starts[0] != 0):
+                if len(carry) >= min_length:
+                    strings.append(carry.decode('ascii'))
+                carry = b''
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                run = carry + bytes(chunk[start:end])
+                carry = b''
+                if end == len(chunk):
+                    carry = run
+                elif len(run) >= min_length:
+                    strings.append(run.decode('ascii'))
+        if len(carry) >= min_length:
+            strings.append(carry.decode('ascii'))
+
+        self.analysis_results["file_hash"] = hasher.hexdigest()
+        self.analysis_results["strings"] = strings
+        self.analysis_results["file_entropy"] = self.entropy_from_counts(counts, len(data))
+        logger.info("Calculated file hash: %s", self.analysis_results['file_hash'])
+        logger.info("Extracted strings: %s...", strings[:10])  # Show only first 10 for brevity
+        logger.info("Calculated file entropy: %s", self.analysis_results['file_entropy'])
+
+    def get_pe(self) -> pefile.PE:
+        """Return the parsed PE file, parsing it on first use."""
+        if self._pe is None:
+            # Parse only the import directory; the other directories are not used
+            if self._mmap is not None:
+                pe = pefile.PE(data=self._mmap, fast_load=True)
+            else:
+                pe = pefile.PE(self.sample_path, fast_load=True)
+            pe.parse_data_directories(directories=[pefile.DIRECTORY_ENTRY['IMAGE_DIRECTORY_ENTRY_IMPORT']])
+            self._pe = pe
+        return self._pe
+
     def detect_file_type(self) -> str:
         """Detect the file type of the sample using mimetypes."""
         mime_type, _ = mimetypes.guess_type(self.sample_path)
@@ -66,92 +223,80 @@ class StaticAnalyzer:
         return mime_type or "unknown"
 
     def calculate_file_hash(self) -> str:
-        """Calculate the SHA-256 hash of the file."""
-        hasher = hashlib.sha256()
-        with open(self.sample_path, 'rb') as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        file_hash = hasher.hexdigest()
-        logger.info(f"Calculated file hash: {file_hash}")
-        return file_hash
+        """Calculate the SHA-256 hash of the file, in the same pass as strings and entropy."""
+        self.scan_sample()
+        return self.analysis_results["file_hash"]
 
     def extract_metadata(self):
         """Extract metadata from the sample."""
         try:
-            file_stats = os.stat(self.sample_path)
+            file_stats = self.get_stat()
             self.analysis_results["metadata"] = {
                 "size": file_stats.st_size,
                 "creation_time": file_stats.st_ctime,
                 "modification_time": file_stats.st_mtime,
                 "access_time": file_stats.st_atime,
             }
-            logger.info(f"Extracted metadata: {self.analysis_results['metadata']}")
+            logger.info("Extracted metadata: %s", self.analysis_results['metadata'])
         except Exception as e:
             logger.error(f"Error extracting metadata: {e}")
 
     def analyze_pe_file(self):
         """Analyze Portable Executable (PE) files."""
         try:
-            pe = pefile.PE(self.sample_path)
+            pe = self.get_pe()
             self.analysis_results["sections"] = [section.Name.decode().rstrip('\x00') for section in pe.sections]
             self.analysis_results["imports"] = [imp.name.decode() for imp in pe.DIRECTORY_ENTRY_IMPORT]
 
-            logger.info(f"PE Sections: {self.analysis_results['sections']}")
-            logger.info(f"PE Imports: {self.analysis_results['imports']}")
+            logger.info("PE Sections: %s", self.analysis_results['sections'])
+            logger.info("PE Imports: %s", self.analysis_results['imports'])
         except Exception as e:
             logger.error(f"Error analyzing PE file: {e}")
 
     def analyze_strings(self):
-        """Extract and analyze strings from the binary."""
+        """Extract and analyze strings from the binary, in the same pass as the hash and entropy."""
         try:
-            with open(self.sample_path, 'rb') as f:
-                data = f.read()
-                strings = self.extract_strings(data)
-                self.analysis_results["strings"] = strings
-                logger.info(f"Extracted strings: {strings[:10]}...")  # Show only first 10 for brevity
+            self.scan_sample()
         except Exception as e:
             logger.error(f"Error analyzing strings: {e}")
 
-    def extract_strings(self, data: bytes, min_length: int = 4) -> List[str]:
-        """Extract printable strings from binary data."""
-        strings = []
-        current_string = []
-        for byte in data:
-            if 32 <= byte <= 126:  # Printable ASCII range
-                current_string.append(chr(byte))
-            else:
-                if len(current_string) >= min_length:
-                    strings.append(''.join(current_string))
-                current_string = []
-        # Catch any remaining string
-        if len(current_string) >= min_length:
-            strings.append(''.join(current_string))
-        return strings
+    @staticmethod
+    def find_printable_runs(arr: np.ndarray):
+        """Return start and end offsets of every run of printable ASCII bytes."""
+        # Branchless printable test: bytes below 32 wrap around past 95 when shifted down
+        padded = np.zeros(len(arr) + 2, dtype=bool)
+        padded[1:-1] = (arr - np.uint8(32)) < np.uint8(95)
+        # Runs start and end wherever the mask flips; the padding closes runs at either end
+        edges = np.flatnonzero(padded[1:] != padded[:-1])
+        return edges[::2], edges[1::2]
 
     def match_signatures(self):
         """Match the sample against known malware signatures."""
-        # Example of a simple signature database (In real scenarios, load from a file or database)
-        known_signatures = {
-            "malware_signature_1": ["malicious_string_1", "malicious_string_2"],
-            "malware_signature_2": ["malicious_string_3"],
-        }
+        # NUL never occurs inside an extracted string, so patterns cannot match across two strings
+        blob = '\0'.join(self.analysis_results["strings"])
+        if _SIGNATURE_AUTOMATON is not None:
+            matched = set()
+            for _, signatures in _SIGNATURE_AUTOMATON.iter(blob):
+                matched.update(signatures)
+        else:
+            matched = {signature for signature, patterns in KNOWN_SIGNATURES.items()
+                       if any(pattern in blob for pattern in patterns)}
 
-        for signature, patterns in known_signatures.items():
-            if any(pattern in ' '.join(self.analysis_results["strings"]) for pattern in patterns):
-                self.analysis_results["signature_matches"].append(signature)
+        self.analysis_results["signature_matches"].extend(
+            signature for signature in KNOWN_SIGNATURES if signature in matched)
 
-        logger.info(f"Matched signatures: {self.analysis_results['signature_matches']}")
+        logger.info("Matched signatures: %s", self.analysis_results['signature_matches'])
 
     def analyze_entropy(self):
         """Calculate entropy of the sections to identify packed/encrypted content."""
         try:
-            pe = pefile.PE(self.sample_path)
+            pe = self.get_pe()
             for section in pe.sections:
                 section_data = section.get_data()
                 entropy_value = self.calculate_entropy(section_data)
                 self.analysis_results["entropy"][section.Name.decode().rstrip('\x00')] = entropy_value
 
-            logger.info(f"Calculated entropy values: {self.analysis_results['entropy']}")
+            logger.info("Calculated entropy values: %s", self.analysis_results['entropy'])
         except Exception as e:
             logger.error(f"Error calculating entropy: {e}")
 
@@ -159,16 +304,16 @@ class StaticAnalyzer:
         """Calculate the Shannon entropy of given data."""
         if not data:
             return 0.0
-        frequency = [0] * 256
-        for byte in data:
-            frequency[byte] += 1
-        entropy = 0.0
-        length = len(data)
-        for freq in frequency:
-            if freq > 0:
-                p_x = freq / length
-                entropy -= p_x * math.log2(p_x)
-        return entropy
+        counts = np.bincount(np.frombuffer(data, dtype=np.uint8), minlength=256)
+        return self.entropy_from_counts(counts, len(data))
+
+    @staticmethod
+    def entropy_from_counts(counts: np.ndarray, length: int) -> float:
+        """Calculate the Shannon entropy from a 256-bin byte histogram."""
+        if not length:
+            return 0.0
+        p_x = counts[counts > 0] / length
+        return 0.0 - float(np.sum(p_x * np.log2(p_x)))
 
     def extract_api_calls(self):
         """Placeholder for extracting API calls made by the malware."""
@@ -178,11 +323,10 @@ class StaticAnalyzer:
     def generate_hex_dump(self):
         """Generate a hex dump of the malware sample."""
         try:
-            with open(self.sample_path, 'rb') as f:
-                data = f.read()
-                hex_dump = binascii.hexlify(data).decode()
-                self.analysis_results["hex_dump"] = hex_dump[:1000]  # Limit to first 1000 chars
-            logger.info(f"Generated hex dump (truncated): {self.analysis_results['hex_dump']}")
+            # Only the leading bytes are kept, so only those are hexlified
+            head = self.read_sample(HEX_DUMP_BYTES)
+            self.analysis_results["hex_dump"] = binascii.hexlify(head).decode()
+            logger.info("Generated hex dump (truncated): %s", self.analysis_results['hex_dump'])
         except Exception as e:
             logger.error(f"Error generating hex dump: {e}")
 
@@ -191,15 +335,17 @@ class StaticAnalyzer:
         if self.analysis_results["signature_matches"]:
             for signature in self.analysis_results["signature_matches"]:
                 self.analysis_results["ioc_logs"].append(f"Matched signature: {signature}")
-        if self.analysis_results["strings"]:
-            for s in self.analysis_results["strings"]:
-                self.analysis_results["ioc_logs"].append(f"Found string: {s}")
+        strings = self.analysis_results["strings"]
+        if strings:
+            # Summarize instead of copying every string; the full list is already in "strings"
+            self.analysis_results["ioc_logs"].append(
+                f"{len(strings)} strings found; sample: {strings[:IOC_STRING_SAMPLE_SIZE]}")
 
-        logger.info(f"Logged indicators of compromise: {self.analysis_results['ioc_logs']}")
+        logger.info("Logged indicators of compromise: %s", self.analysis_results['ioc_logs'])
 
     def analyze_binary_size(self):
         """Analyze the binary size for common malware patterns."""
-        size = os.path.getsize(self.sample_path)
+        size = self.get_stat().st_size
         self.analysis_results["binary_size"] = size
         logger.info(f"Binary size: {size} bytes")
 
@@ -225,12 +371,10 @@ class StaticAnalyzer:
     def match_clamav_rules(self):
         """Match the sample against ClamAV."""
         try:
-            self.cd = pyclamd.ClamdUnixSocket()  # Initialize the ClamAV connection
+            self.cd = get_clamd()  # Reuse the shared ClamAV connection
 
             # Check if ClamAV is running
-            if self.cd.ping():
-                logger.info("ClamAV is running.")
-            else:
+            if self.cd is None:
                 logger.error("ClamAV is not running. Cannot perform scan.")
                 return
 
@@ -238,20 +382,23 @@ class StaticAnalyzer:
             scan_result = self.cd.scan_file(self.sample_path)
             if scan_result:
                 self.analysis_results["clamav_matches"] = [result[0] for result in scan_result.values()]
-                logger.info(f"ClamAV matches: {self.analysis_results['clamav_matches']}")
+                logger.info("ClamAV matches: %s", self.analysis_results['clamav_matches'])
             else:
                 logger.info("No ClamAV matches found.")
 
         except Exception as e:
             logger.error(f"Error matching ClamAV rules: {e}")
 
-if __name__ == "__main__":
+def main():
     # Dynamically get the sample path from user input
     sample_path = input("Enter the path to the malware sample (e.g., path_to_your_sample.exe): ").strip()
     analyzer = StaticAnalyzer(sample_path)
     results = analyzer.analyze()
 
     # Optionally save results to a JSON file
-    with open('analysis_results.json', 'w') as f:
-        json.dump(results, f, indent=4)
+    with open('analysis_results.json', 'wb') as f:
+        f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     logger.info("Analysis results saved to analysis_results.json")
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,117 @@
-import json
+import io
 import csv
 import logging
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional
+import orjson
+from collections import Counter
+from functools import lru_cache
+try:
+    from lxml import etree as ET  # libxml2-backed parser, API compatible with ElementTree
+    # Reports come from untrusted samples: never expand entities or fetch external resources
+    XML_PARSER_OPTIONS = {"resolve_entities": False, "no_network": True, "huge_tree": False}
+    XML_PARSER = ET.XMLParser(**XML_PARSER_OPTIONS)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    XML_PARSER_OPTIONS = {}
+    XML_PARSER = None  # The stdlib parser never fetches external entities
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+EXPORT_BUFFER_SIZE = 1024 * 1024  # Large write buffer so exports need few write syscalls
+XML_STREAM_THRESHOLD = 1024 * 1024  # Larger XML documents are streamed instead of built as a tree
+TRIVIAL_JSON_MAX_LENGTH = 16  # Inputs this short are checked for empty or trivial JSON first
+
+@lru_cache(maxsize=1024)
+def _normalize_api_calls(api_calls: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lower-case a sequence of API calls; memoized because batches repeat traces."""
+    # Traces repeat a small vocabulary, so lower-case each distinct name only once
+    lowered = {name: name.lower() for name in set(api_calls)}
+    return tuple(map(lowered.__getitem__, api_calls))
+
+@lru_cache(maxsize=1024)
+def _aggregate_api_calls(api_calls: Tuple[str, ...]) -> Tuple[Tuple[str, int], ...]:
+    """Count normalized API calls; memoized so repeated traces are counted once."""
+    # Count the raw names in C first, then fold case over the distinct names only
+    raw_counts = Counter(api_calls)
+    keys = [name.lower() for name in raw_counts]
+    counts: Dict[str, int] = dict.fromkeys(keys, 0)  # Sized up front, in first-seen order
+    for key, count in zip(keys, raw_counts.values()):
+        counts[key] += count
+    return tuple(counts.items())
+
 class DataParser:
     def __init__(self, data: Dict[str, Any]):
         self.data = data
 
-    def parse_json(self, json_data: str) -> Dict:
-        """Parse JSON data into a dictionary."""
+    def parse_json(self, json_data: Union[str, bytes, bytearray, memoryview]) -> Dict:
+        """Parse JSON data into a dictionary; raw bytes are parsed without decoding to str first."""
+        # Empty and trivial documents are common and need no parser; larger inputs skip
+        # this check so they are never copied by strip()
+        if len(json_data) <= TRIVIAL_JSON_MAX_LENGTH:
+            trivial = bytes(json_data).strip() if not isinstance(json_data, str) else json_data.strip().encode()
+            if trivial in (b"", b"{}"):
+                return {}
+            if trivial == b"[]":
+                return []
+            if trivial == b"null":
+                return None
         try:
-            parsed_data = json.loads(json_data)
+            parsed_data = orjson.loads(json_data)
             logger.info("Successfully parsed JSON data.")
             return parsed_data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON data: {e}")
             return {}
 
-    def parse_xml(self, xml_data: str) -> Dict:
+    def parse_xml(self, xml_data: Union[str, bytes]) -> Dict:
         """Parse XML data into a dictionary."""
         try:
-            root = ET.fromstring(xml_data)
-            parsed_data = {child.tag: child.text for child in root}
+            if isinstance(xml_data, str):
+                xml_data = xml_data.encode('utf-8')
+            if len(xml_data) > XML_STREAM_THRESHOLD:
+                parsed_data = self.parse_xml_stream(xml_data)
+            else:
+                root = ET.fromstring(xml_data, XML_PARSER)
+                # lxml yields comments and processing instructions as children too; keep elements only
+                parsed_data = {child.tag: child.text for child in root if isinstance(child.tag, str)}
             logger.info("Successfully parsed XML data.")
             return parsed_data
         except ET.ParseError as e:
             logger.error(f"Failed to parse XML data: {e}")
             return {}
 
+    @staticmethod
+    def parse_xml_stream(xml_data: bytes) -> Dict:
+        """Collect the root's child elements while streaming, without keeping the whole tree."""
+        parsed_data = {}
+        depth = 0
+        root = None
+        for event, element in ET.iterparse(io.BytesIO(xml_data), events=("start", "end"), **XML_PARSER_OPTIONS):
+            if event == "start":
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1:
+                if isinstance(element.tag, str):
+                    parsed_data[element.tag] = element.text
+                # Drop finished children from the root too, so memory stays bounded by one child
+                if XML_PARSER is not None:
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+                else:
+                    root.clear()
+        return parsed_data
+
     def parse_txt(self, txt_data: str) -> Dict:
         """Parse TXT data into a dictionary (key-value pairs)."""
         try:
-            parsed_data = {}
-            for line in txt_data.splitlines():
-                key, value = line.split(':', 1)
-                parsed_data[key.strip()] = value.strip()
+            parsed_data = {key.strip(): value.strip()
+                           for key, value in (line.split(':', 1) for line in txt_data.splitlines())}
             logger.info("Successfully parsed TXT data.")
             return parsed_data
         except Exception as e:
@@ -49,7 +121,7 @@ class DataParser:
     def export_to_csv(self, filename: str) -> None:
         """Export data to a CSV file."""
         try:
-            with open(filename, mode='w', newline='') as csvfile:
+            with open(filename, mode='w', newline='', buffering=EXPORT_BUFFER_SIZE) as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(self.data.keys())  # Write header
                 writer.writerow(self.data.values())  # Write data
@@ -60,8 +132,8 @@ class DataParser:
     def export_to_json(self, filename: str) -> None:
         """Export data to a JSON file."""
         try:
-            with open(filename, mode='w') as jsonfile:
-                json.dump(self.data, jsonfile, indent=4)
+            with open(filename, mode='wb', buffering=EXPORT_BUFFER_SIZE) as jsonfile:
+                jsonfile.write(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
             logger.info(f"Data successfully exported to {filename}.")
         except Exception as e:
             logger.error(f"Error exporting data to JSON: {e}")
@@ -77,34 +149,26 @@ class DataParser:
             logger.error("Missing required fields in data.")
             return False
         
-        logger.info("Data validation successful.")
+        logger.debug("Data validation successful.")
         return True
 
     def normalize_api_calls(self) -> List[str]:
         """Normalize API calls for consistent representation."""
-        normalized_calls = [call.lower() for call in self.data.get("api_calls", [])]
-        logger.info("API calls normalized.")
+        normalized_calls = list(_normalize_api_calls(tuple(self.data.get("api_calls", ()))))
+        logger.debug("API calls normalized.")
         return normalized_calls
 
     def aggregate_api_calls(self) -> Dict[str, int]:
         """Aggregate API calls and count their frequencies."""
-        api_calls = self.normalize_api_calls()
-        aggregated_data = {}
-        
-        for call in api_calls:
-            if call in aggregated_data:
-                aggregated_data[call] += 1
-            else:
-                aggregated_data[call] = 1
-        
-        logger.info("API call aggregation complete.")
+        aggregated_data = dict(_aggregate_api_calls(tuple(self.data.get("api_calls", ()))))
+        logger.debug("API call aggregation complete.")
         return aggregated_data
 
     def enrich_data(self) -> None:
         """Enrich data by looking up additional information (stub for database/API call)."""
         # This is a stub; in a real implementation, you would query a database or external service.
         self.data["enrichment"] = "Enriched data based on file_hash"
-        logger.info("Data enrichment completed.")
+        logger.debug("Data enrichment completed.")
 
     def generate_summary_report(self) -> str:
         """Generate a summary report after processing data."""
@@ -114,44 +178,51 @@ class DataParser:
         api_calls_count = self.aggregate_api_calls()
         summary += f"API Calls: {len(api_calls_count)}\n"
         summary += f"Aggregated API Calls: {api_calls_count}\n"
-        logger.info("Summary report generated.")
+        logger.debug("Summary report generated.")
         return summary
 
     def process_analysis_results(self) -> None:
         """Process the analysis results to extract relevant information."""
+        report = self._process_entry()
+        if report is not None:
+            logger.info("Summary Report:\n%s", report)
+
+    def _process_entry(self) -> Optional[str]:
+        """Validate, enrich and summarize the current data, returning the report or None if invalid."""
         if not self.validate_data():
             logger.error("Data validation failed. Processing aborted.")
-            return
+            return None
         
-        logger.info("Processing analysis results.")
+        logger.debug("Processing analysis results.")
         self.enrich_data()
         api_call_counts = self.aggregate_api_calls()
-        logger.info(f"API Call Counts: {api_call_counts}")
-
-        # Generate and log summary report
-        report = self.generate_summary_report()
-        logger.info(f"Summary Report:\n{report}")
+        logger.debug("API Call Counts: %s", api_call_counts)
+        return self.generate_summary_report()
 
     def batch_process_data(self, data_list: List[Dict[str, Any]]) -> None:
         """Process a list of analysis results."""
         error_summary = []
         total_entries = len(data_list)
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        logger.info("Batch of %d entries starting.", total_entries)
         for idx, data in enumerate(data_list):
-            logger.info(f"Processing data entry {idx + 1}/{total_entries}")
+            if debug_enabled:
+                logger.debug("Processing data entry %d/%d", idx + 1, total_entries)
             self.data = data
             try:
-                self.process_analysis_results()
+                report = self._process_entry()
+                if debug_enabled and report is not None:
+                    logger.debug("Summary Report:\n%s", report)
             except Exception as e:
                 error_summary.append(f"Error processing data entry {idx + 1}: {str(e)}")
-        
+
+        logger.info("Processed %d entries, %d errors.", total_entries, len(error_summary))
         if error_summary:
-            logger.error("Batch processing completed with errors:")
-            for error in error_summary:
-                logger.error(error)
+            logger.error("Batch processing completed with errors:\n%s", "\n".join(error_summary))
         else:
             logger.info("Batch processing completed successfully.")
 
-if __name__ == "__main__":
+def main():
     # Example usage
     sample_data = {
         "file_hash": "example_hash",
@@ -184,3 +255,6 @@ if __name__ == "__main__":
     ]
     
     parser.batch_process_data(batch_data)
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,54 @@
 import re
 import logging
-from collections import defaultdict
-from typing import List, Dict, Any, Tuple, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple, Optional, FrozenSet
+
+try:
+    import hyperscan  # Optional single-pass multi-pattern prefilter
+except ImportError:
+    hyperscan = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Above this many patterns one regex/Hyperscan pass beats a str.count per literal
+LITERAL_DISPATCH_MAX_PATTERNS = 32
+
+@lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern:
+    """Compile a regex once per (pattern, flags) and share it across recognizers."""
+    # Unlike re's internal cache, this one is not churned by unrelated regex use elsewhere
+    return re.compile(pattern, flags)
+
+def literals_never_overlap(literals: List[str]) -> bool:
+    """Check that no literal contains another or overlaps it, so str.count equals alternation matching."""
+    for first in literals:
+        for second in literals:
+            if first is second:
+                continue
+            if first in second:
+                return False
+            # A suffix of one literal that starts the other lets their matches overlap
+            if any(first.endswith(second[:i]) for i in range(1, min(len(first), len(second)))):
+                return False
+    return True
+
 class PatternRecognizer:
     def __init__(self, data: Dict[str, Any]):
         self.data = data
         self.patterns = []
         self.pattern_weights = {}
-        self.pattern_counts = defaultdict(int)
+        self.pattern_counts = Counter()
         self.cache = {}
+        self._valid_patterns: List[str] = []
+        self._compiled: List[re.Pattern] = []
+        self._combined: Optional[re.Pattern] = None
+        self._hs_db = None
+        self._literals: Optional[List[str]] = None
+        self._subset_cache: Dict[FrozenSet[int], re.Pattern] = {}
+        self._patterns_dirty = False
 
     def add_patterns(self, patterns: List[str], weights: Optional[List[int]] = None) -> None:
         """Add patterns for recognition with optional weights."""
@@ -25,46 +60,141 @@ class PatternRecognizer:
         if weights:
             for pattern, weight in zip(patterns, weights):
                 self.pattern_weights[pattern] = weight
-        logger.info(f"Added {len(patterns)} patterns for recognition with weights.")
 
-    def validate_patterns(self) -> List[str]:
-        """Validate patterns to ensure they are well-formed."""
-        valid_patterns = []
-        for pattern in self.patterns:
+        # Compile once here so recognition never recompiles
+        for pattern in patterns:
             try:
-                re.compile(pattern)
-                valid_patterns.append(pattern)
+                self._compiled.append(compile_pattern(pattern))
+                self._valid_patterns.append(pattern)
             except re.error:
                 logger.error(f"Invalid regex pattern: '{pattern}'")
-        return valid_patterns
+        # Combined matchers are rebuilt lazily, so several add_patterns calls compile them once
+        self._patterns_dirty = True
+        logger.info(f"Added {len(patterns)} patterns for recognition with weights.")
 
-    def recognize_patterns_regex(self) -> Dict[str, int]:
-        """Recognize patterns using regular expressions."""
-        valid_patterns = self.validate_patterns()
-        for pattern in valid_patterns:
+    def build_matchers(self) -> None:
+        """Rebuild the combined regex, Hyperscan database and literal set if patterns changed."""
+        if not self._patterns_dirty:
+            return
+        self._patterns_dirty = False
+        self._combined = None
+        if self._valid_patterns:
             try:
-                matches = re.findall(pattern, self.data.get("strings", ""))
-                self.pattern_counts[pattern] += len(matches)
-                logger.info(f"Pattern '{pattern}' matched {len(matches)} times.")
+                self._combined = compile_pattern("|".join(f"({p})" for p in self._valid_patterns))
             except re.error as e:
-                logger.error(f"Regex error for pattern '{pattern}': {e}")
+                # e.g. backreferences, whose group numbers shift once patterns are combined
+                logger.error(f"Regex error while combining patterns: {e}")
+        self._hs_db = self.build_hyperscan_database()
+        self._literals = self.find_literal_patterns()
+        self._subset_cache = {}
+
+    def find_literal_patterns(self) -> Optional[List[str]]:
+        """Return the patterns if they are all plain, non-overlapping literals, else None."""
+        literals = list(dict.fromkeys(self._valid_patterns))
+        if not literals or len(literals) > LITERAL_DISPATCH_MAX_PATTERNS:
+            return None
+        if any(not p or re.escape(p) != p for p in literals):
+            return None
+        return literals if literals_never_overlap(literals) else None
+
+    def build_hyperscan_database(self):
+        """Compile the valid patterns into a Hyperscan database, if Hyperscan supports them all."""
+        if hyperscan is None or not self._valid_patterns:
+            return None
+        try:
+            database = hyperscan.Database()
+            database.compile(expressions=[p.encode() for p in self._valid_patterns],
+                             ids=list(range(len(self._valid_patterns))),
+                             flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(self._valid_patterns))
+            return database
+        except hyperscan.error as e:
+            logger.info(f"Hyperscan prefilter disabled, falling back to regex only: {e}")
+            return None
+
+    def prefilter_patterns(self, text: str) -> Optional[FrozenSet[int]]:
+        """Return the indices of patterns occurring in text, or None if Hyperscan cannot tell."""
+        # Hyperscan classes are byte-oriented, so only ASCII text is guaranteed to agree with re
+        if self._hs_db is None or not isinstance(text, str) or not text.isascii():
+            return None
+        matched = set()
+        self._hs_db.scan(text.encode('ascii'),
+                         match_event_handler=lambda pattern_id, start, end, flags, context: matched.add(pattern_id))
+        return frozenset(matched)
+
+    def get_search_text(self) -> str:
+        """Return the collected strings as a single buffer to scan."""
+        strings = self.data.get("strings", "")
+        if isinstance(strings, str):
+            return strings
+        # NUL cannot occur in an extracted string, so matches never span two of them
+        return "\x00".join(strings)
+
+    def validate_patterns(self) -> List[str]:
+        """Validate patterns to ensure they are well-formed."""
+        return list(self._valid_patterns)
+
+    def extract_patterns(self, text: str) -> List[str]:
+        """Return the valid patterns that occur in text, in the order they were added."""
+        self.build_matchers()
+        if self._literals is not None:
+            found = [literal for literal in self._literals if literal in text]
+        else:
+            # One Hyperscan pass answers for every pattern; otherwise search each compiled pattern
+            matched_ids = self.prefilter_patterns(text)
+            if matched_ids is not None:
+                found = list(dict.fromkeys(self._valid_patterns[i] for i in sorted(matched_ids)))
+            else:
+                found = list(dict.fromkeys(c.pattern for c in self._compiled if c.search(text)))
+        logger.info("Extracted patterns: %s", found)
+        return found
+
+    def recognize_patterns_regex(self) -> Dict[str, int]:
+        """Recognize patterns using regular expressions."""
+        text = self.get_search_text()
+        for compiled in self._compiled:
+            matches = compiled.findall(text)
+            self.pattern_counts[compiled.pattern] += len(matches)
+            logger.info(f"Pattern '{compiled.pattern}' matched {len(matches)} times.")
         return dict(self.pattern_counts)
 
     def recognize_multiple_patterns(self) -> Dict[str, int]:
         """Recognize multiple patterns in a single pass for efficiency."""
-        valid_patterns = self.validate_patterns()
-        combined_pattern = "|".join(f"({p})" for p in valid_patterns)
+        self.build_matchers()
+        if self._combined is None:
+            return dict(self.pattern_counts)
+        text = self.get_search_text()
+        if self._literals is not None:
+            # Plain literals need no regex engine; str.count scans at memchr speed
+            for literal in self._literals:
+                count = text.count(literal)
+                if count:
+                    self.pattern_counts[literal] += count
+            logger.info("Multiple patterns recognized in a single pass.")
+            return dict(self.pattern_counts)
+        combined = self._combined
+        # One DFA pass finds which patterns occur at all. A pattern with no match anywhere
+        # can never win an alternation, so running only the others yields identical results.
+        matched_ids = self.prefilter_patterns(text)
+        if matched_ids is not None:
+            if not matched_ids:
+                logger.info("Multiple patterns recognized in a single pass.")
+                return dict(self.pattern_counts)
+            combined = self._subset_cache.get(matched_ids)
+            if combined is None:
+                combined = compile_pattern("|".join(f"({self._valid_patterns[i]})" for i in sorted(matched_ids)))
+                self._subset_cache[matched_ids] = combined
         try:
-            matches = re.findall(combined_pattern, self.data.get("strings", ""))
-            for match in matches:
-                for group in match:
-                    if group:  # Only count non-empty matches
-                        self.pattern_counts[group] += 1
+            # Counter.update consumes the matched texts in C; filter drops empty matches
+            self.pattern_counts.update(filter(None, map(re.Match.group, combined.finditer(text))))
             logger.info("Multiple patterns recognized in a single pass.")
         except re.error as e:
             logger.error(f"Regex error while recognizing multiple patterns: {e}")
         return dict(self.pattern_counts)
 
+    def reset(self) -> None:
+        """Clear recognized pattern counts so the next recognition starts from zero."""
+        self.pattern_counts.clear()
+
     def dynamic_thresholding(self) -> int:
         """Determine a dynamic threshold based on recognized patterns statistics."""
         if not self.pattern_counts:
@@ -121,11 +251,11 @@ class PatternRecognizer:
         logger.info("Starting pattern recognition process.")
         
         recognized_patterns = self.recognize_multiple_patterns()  # Use multiple patterns method
-        logger.info(f"Recognized patterns: {recognized_patterns}")
+        logger.info("Recognized patterns: %s", recognized_patterns)
 
         # Gather statistics
         stats = self.gather_pattern_statistics()
-        logger.info(f"Pattern Statistics: {stats}")
+        logger.info("Pattern Statistics: %s", stats)
 
         # Cache results
         self.cache_results()
@@ -133,7 +263,7 @@ class PatternRecognizer:
         # Visualize patterns
         self.visualize_patterns()
 
-if __name__ == "__main__":
+def main():
     # Example usage
     sample_data = {
         "strings": "malicious_string_1 malicious_string_2 benign_string_1",
@@ -146,4 +276,7 @@ if __name__ == "__main__":
     
     # Example of filtering low-frequency patterns
     filtered_patterns = recognizer.filter_low_frequency_patterns()
-    logger.info(f"Filtered Patterns: {filtered_patterns}")
+    logger.info("Filtered Patterns: %s", filtered_patterns)
+
+if __name__ == "__main__":
+    main()
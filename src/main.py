@@ -1,20 +1,14 @@
 import logging
 import os
 import sys
-import json
+import orjson
 import time
 import shutil
-import threading
-from tqdm import tqdm
-import smtplib
-from email.mime.text import MIMEText
-from data_collection.dynamic_analysis import DynamicAnalyzer
-from data_collection.static_analysis import StaticAnalyzer
-from data_processing.data_parser import DataParser
-from data_processing.pattern_recognition import PatternRecognizer
-from visualization.graph_builder import GraphBuilder
-from visualization.visualizer import Visualizer
-from ui.main_window import MainWindow
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+# Heavy dependencies (analysis, plotting, Qt, tqdm, smtplib) are imported where they are
+# used, so the first prompt appears without waiting for them to load
 
 # Configure logging
 def configure_logging(log_level):
@@ -26,11 +20,14 @@ def configure_logging(log_level):
 
 def load_config(config_path):
     """Load configuration settings from a JSON file."""
-    with open(config_path, 'r') as f:
-        return json.load(f)
+    with open(config_path, 'rb') as f:
+        return orjson.loads(f.read())  # Parsed straight from the bytes read
 
 def send_error_report(email_address, error_message):
     """Send an error report to the specified email address."""
+    import smtplib
+    from email.mime.text import MIMEText
+
     msg = MIMEText(error_message)
     msg['Subject'] = 'Visual Malware Signature Generator - Error Report'
     msg['From'] = 'your_email@example.com'  # Replace with your sender email
@@ -55,8 +52,16 @@ def collect_user_feedback():
 
 def backup_results(output_dir):
     """Backup the analysis results."""
-    backup_dir = f"{output_dir}_backup_{int(time.time())}"
-    shutil.copytree(output_dir, backup_dir)
+    backup_dir = f"{os.path.normpath(output_dir)}_backup_{int(time.time())}"
+    # Hardlinks would be cheaper still, but later runs rewrite the output files in place and
+    # would change the backup with them. A copy-on-write clone is instant on btrfs/XFS and
+    # cp falls back to an ordinary copy on other filesystems.
+    cloned = False
+    if sys.platform.startswith('linux') and shutil.which('cp'):
+        result = subprocess.run(['cp', '-r', '--reflink=auto', output_dir, backup_dir], capture_output=True)
+        cloned = result.returncode == 0
+    if not cloned:
+        shutil.copytree(output_dir, backup_dir, dirs_exist_ok=True)
     logging.info(f"Backup created at: {backup_dir}")
 
 def generate_summary_report(patterns, output_dir):
@@ -71,11 +76,21 @@ def generate_summary_report(patterns, output_dir):
             report_file.write(f"- {pattern}\n")
     logging.info(f"Summary report generated at: {report_path}")
 
-def run_analysis(analyzer):
+def set_progress(pbar, percent):
+    """Move a progress bar to the given percentage; called from worker threads."""
+    pbar.n = percent
+    pbar.refresh()
+
+def run_analysis(analyzer, report_progress=None):
     """Run data collection and processing in a separate thread."""
+    from data_processing.data_parser import DataParser
+    from data_processing.pattern_recognition import PatternRecognizer
+
     logging.info("Collecting data...")
     samples_data = analyzer.analyze()
     logging.info("Data collection complete.")
+    if report_progress:
+        report_progress(50)
     
     logging.info("Processing data...")
     parser = DataParser(samples_data)
@@ -83,19 +98,29 @@ def run_analysis(analyzer):
     recognizer = PatternRecognizer(processed_data)
     patterns = recognizer.recognize_patterns()
     logging.info("Data processing complete.")
+    if report_progress:
+        report_progress(100)
     
     return patterns
 
-def run_visualization(graph, output_dir, output_format):
+def run_visualization(graph, output_dir, output_format, report_progress=None):
     """Run the visualization process in a separate thread."""
+    from visualization.visualizer import Visualizer
+
     visualizer = Visualizer(graph)
     visualizer.visualize(output_dir, output_format)
+    if report_progress:
+        report_progress(100)
 
 def start_analysis(samples, analysis_mode, output_dir, config, console_output, email_errors):
+    from tqdm import tqdm
+
     # Initialize analyzers based on the selected mode
     if analysis_mode == 'static':
+        from data_collection.static_analysis import StaticAnalyzer
         analyzer = StaticAnalyzer(samples)
     elif analysis_mode == 'dynamic':
+        from data_collection.dynamic_analysis import DynamicAnalyzer
         analyzer = DynamicAnalyzer(samples)
     else:
         logging.error("Invalid analysis mode selected.")
@@ -104,39 +129,27 @@ def start_analysis(samples, analysis_mode, output_dir, config, console_output, e
             send_error_report(email_errors, "Invalid analysis mode selected.")
         sys.exit(1)
 
-    # Run analysis in a separate thread
-    analysis_thread = threading.Thread(target=run_analysis, args=(analyzer,))
-    analysis_thread.start()
-    
-    # Display progress bar while waiting for analysis to complete
-    with tqdm(total=100, desc="Analysis Progress", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}") as pbar:
-        while analysis_thread.is_alive():
-            pbar.update(10)  # Update progress every 10 seconds
-            time.sleep(10)   # Adjust this value based on expected time
-    
-    analysis_thread.join()  # Wait for analysis to complete
-    
-    # Retrieve patterns (assuming this is how the result is stored)
-    patterns = analysis_thread.result()  # You might need to adjust this depending on your threading implementation
+    # Run analysis in a separate thread; the bar advances as stages finish and
+    # result() returns as soon as the work is done rather than on a polling tick
+    with ThreadPoolExecutor(max_workers=1) as executor, \
+            tqdm(total=100, desc="Analysis Progress", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}") as pbar:
+        analysis_future = executor.submit(run_analysis, analyzer, partial(set_progress, pbar))
+        patterns = analysis_future.result()
     
     # Visualize data
     try:
         logging.info("Visualizing data...")
+        from visualization.graph_builder import GraphBuilder
         graph_builder = GraphBuilder(patterns)
         graph = graph_builder.build_graph()
 
         # Run visualization in a separate thread
         output_format = config.get('output_format', 'png')
-        visualization_thread = threading.Thread(target=run_visualization, args=(graph, output_dir, output_format))
-        visualization_thread.start()
-
-        # Display progress for visualization
-        with tqdm(total=100, desc="Visualization Progress", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}") as vbar:
-            while visualization_thread.is_alive():
-                vbar.update(10)  # Update progress every 10 seconds
-                time.sleep(10)   # Adjust this value based on expected time
-
-        visualization_thread.join()  # Wait for visualization to complete
+        with ThreadPoolExecutor(max_workers=1) as executor, \
+                tqdm(total=100, desc="Visualization Progress", bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt}") as vbar:
+            visualization_future = executor.submit(run_visualization, graph, output_dir, output_format,
+                                                   partial(set_progress, vbar))
+            visualization_future.result()  # Re-raises any visualization error here
         logging.info("Data visualization complete.")
 
         # Output to console if requested
@@ -194,6 +207,7 @@ def main():
     # Launch GUI
     try:
         logging.info("Launching user interface...")
+        from ui.main_window import MainWindow
         app = MainWindow(output_dir)
         app.run()  # This should start the GUI main loop
     except Exception as e:
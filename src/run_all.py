@@ -1,26 +1,34 @@
 # src/run_all.py
 
-import subprocess
+import os
+import sys
+import importlib
+import traceback
 
-def run_script(script):
-    result = subprocess.run(["python", script], capture_output=True, text=True)
-    print(result.stdout)
-    if result.returncode != 0:
-        print(f"Error running {script}:\n{result.stderr}")
+# Stages are imported from the src directory, the same way each script resolves its imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+def run_module(module_name):
+    try:
+        module = importlib.import_module(module_name)
+        module.main()
+    except (Exception, SystemExit):
+        print(f"Error running {module_name}:\n{traceback.format_exc()}")
 
 def main():
-    scripts = [
-        "data_collection/static_analysis.py",
-        "data_collection/dynamic_analysis.py",
-        "data_processing/data_parser.py",
-        "data_processing/pattern_recognition.py",
-        "visualization/graph_builder.py",
-        "visualization/visualizer.py",
-        "main.py"
+    modules = [
+        "data_collection.static_analysis",
+        "data_collection.dynamic_analysis",
+        "data_processing.data_parser",
+        "data_processing.pattern_recognition",
+        "visualization.graph_builder",
+        "visualization.visualizer",
+        "main"
     ]
 
-    for script in scripts:
-        run_script(f"src/{script}")
+    # Run every stage in this interpreter so heavy imports are paid only once
+    for module_name in modules:
+        run_module(module_name)
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,14 @@
 import unittest
+import logging
 import os
 
+def setUpModule():
+    """Silence logging while a test module runs; log output would otherwise skew timing tests."""
+    logging.disable(logging.CRITICAL)
+
+def tearDownModule():
+    logging.disable(logging.NOTSET)
+
 # Automatically discover and load tests from the tests directory
 def load_tests(loader, tests, ignore):
     """Load tests from all test files in the tests directory."""
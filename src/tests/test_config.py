@@ -0,0 +1,38 @@
+import os
+import tempfile
+import unittest
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+from src.config import Config
+
+class TestYamlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "config.yaml")
+        self.cache_file = f"{self.path}.cache.json"
+        self.config = Config.__new__(Config)  # Only the loader is exercised, not validation
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def test_cached_load_matches_fresh_load(self):
+        """Test a second load is served from the JSON cache with the same content."""
+        self.write("data_directory: data\nfile_types: [exe, dll]\nemail_settings: {smtp_port: 587}\n")
+        fresh = self.config.load_yaml_with_cache(self.path)
+        self.assertTrue(os.path.exists(self.cache_file))
+        self.assertEqual(self.config.load_yaml_with_cache(self.path), fresh)
+
+    def test_non_string_keys_not_cached(self):
+        """Test trees with int or bool keys skip the cache, so they keep their key types."""
+        self.write("ports:\n  1: smtp\n  true: enabled\n")
+        fresh = self.config.load_yaml_with_cache(self.path)
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertEqual(self.config.load_yaml_with_cache(self.path), fresh)
+        self.assertEqual(fresh, {"ports": {1: "smtp", True: "enabled"}})
+
+if __name__ == '__main__':
+    unittest.main()
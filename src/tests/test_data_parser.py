@@ -0,0 +1,98 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+import orjson
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+from src.data_processing.data_parser import DataParser
+
+class TestJsonParsing(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the parser and the large payload once for the whole class."""
+        cls.parser = DataParser({})
+        # Serialized once, as bytes, so parse timings do not include building the input
+        cls.large_data = orjson.dumps({"data": [{"key": f"value{i}"} for i in range(10000)]})
+
+    def test_str_and_bytes_like_input(self):
+        """Test str, bytes, bytearray and memoryview input parse to the same result."""
+        text = '{"file_hash": "abc", "strings": ["x"]}'
+        for data in (text, text.encode(), bytearray(text.encode()), memoryview(text.encode())):
+            with self.subTest(type=type(data).__name__):
+                self.assertEqual(self.parser.parse_json(data), {"file_hash": "abc", "strings": ["x"]})
+
+    def test_trivial_documents(self):
+        """Test empty and trivial documents are answered without orjson."""
+        with patch('src.data_processing.data_parser.orjson.loads') as mock_loads:
+            self.assertEqual(self.parser.parse_json(""), {})
+            self.assertEqual(self.parser.parse_json(b" {} "), {})
+            self.assertEqual(self.parser.parse_json("[]"), [])
+            self.assertIsNone(self.parser.parse_json(b"null"))
+            mock_loads.assert_not_called()
+
+    def test_invalid_json(self):
+        """Test invalid JSON is reported as an empty dictionary."""
+        self.assertEqual(self.parser.parse_json('{"key": '), {})
+
+    def test_performance_of_data_parsing(self):
+        """Test a 10,000 entry document parses well within a second."""
+        start_time = time.time()
+        parsed = self.parser.parse_json(self.large_data)
+        self.assertLess(time.time() - start_time, 1)
+        self.assertEqual(len(parsed["data"]), 10000)
+
+class TestXmlParsing(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = DataParser({})
+
+    def test_parse_xml(self):
+        """Test the root's child elements become a dictionary."""
+        self.assertEqual(self.parser.parse_xml("<report><hash>abc</hash><type>exe</type></report>"),
+                         {"hash": "abc", "type": "exe"})
+
+    def test_external_entity_not_resolved(self):
+        """Test external entities in untrusted reports are never read."""
+        fd, secret = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write("secret")
+        try:
+            xml = (f'<?xml version="1.0"?><!DOCTYPE r [<!ENTITY x SYSTEM "file://{secret}">]>'
+                   '<r><hash>&x;</hash></r>')
+            for threshold in (1 << 20, 0):  # Tree and streaming parsers
+                with self.subTest(threshold=threshold), \
+                        patch('src.data_processing.data_parser.XML_STREAM_THRESHOLD', threshold):
+                    self.assertNotIn("secret", str(self.parser.parse_xml(xml)))
+        finally:
+            os.remove(secret)
+
+    def test_stream_matches_tree(self):
+        """Test streaming a document gives the same result as building its tree."""
+        xml = "<r>" + "".join(f"<k{i}>v{i}<sub>x</sub></k{i}>" for i in range(1000)) + "</r>"
+        tree = self.parser.parse_xml(xml)
+        with patch('src.data_processing.data_parser.XML_STREAM_THRESHOLD', 0):
+            self.assertEqual(self.parser.parse_xml(xml), tree)
+
+class TestBatchProcessing(unittest.TestCase):
+
+    def test_entries_enriched_and_errors_collected(self):
+        """Test each valid entry is enriched in place and invalid ones do not stop the batch."""
+        batch = [
+            {"file_hash": "hash_1", "strings": [], "api_calls": ["ReadFile", "readfile"]},
+            {"file_hash": "hash_2", "strings": [], "api_calls": None},  # Cannot be counted
+            {"file_hash": "hash_3"},  # Fails validation
+            {"file_hash": "hash_4", "strings": ["s"], "api_calls": ["LoadLibraryA"]},
+        ]
+        parser = DataParser({})
+        with patch('src.data_processing.data_parser.logger') as mock_logger:
+            parser.batch_process_data(batch)
+        self.assertIn("enrichment", batch[0])
+        self.assertIn("enrichment", batch[3])
+        self.assertNotIn("enrichment", batch[2])
+        self.assertIs(parser.data, batch[-1])
+        mock_logger.info.assert_any_call("Processed %d entries, %d errors.", 4, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from cryptography.exceptions import InvalidTag
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+from src.utils.file_operations import FileOperations, NONCE_SIZE, TAG_SIZE
+
+class TestFileEncryption(unittest.TestCase):
+
+    PLAINTEXT = b"sample report line\n" * 1000
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "report.txt")
+        with open(self.path, 'wb') as f:
+            f.write(self.PLAINTEXT)
+        self.file_ops = FileOperations()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def read(self):
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+    def test_round_trip(self):
+        """Test AES-GCM encryption adds a nonce and tag and decrypts back to the original."""
+        self.assertTrue(self.file_ops.encrypt_file(self.path))
+        encrypted = self.read()
+        self.assertEqual(len(encrypted), NONCE_SIZE + len(self.PLAINTEXT) + TAG_SIZE)
+        self.assertNotIn(self.PLAINTEXT[:32], encrypted)
+
+        self.assertTrue(self.file_ops.decrypt_file(self.path))
+        self.assertEqual(self.read(), self.PLAINTEXT)
+
+    def test_round_trip_across_chunks(self):
+        """Test files spanning several streaming chunks decrypt intact."""
+        with patch('src.utils.file_operations.CHUNK_SIZE', 1000):
+            self.file_ops.encrypt_file(self.path)
+            self.file_ops.decrypt_file(self.path)
+        self.assertEqual(self.read(), self.PLAINTEXT)
+
+    def test_tampered_file_rejected(self):
+        """Test a modified ciphertext fails authentication and is left in place."""
+        self.file_ops.encrypt_file(self.path)
+        encrypted = bytearray(self.read())
+        encrypted[NONCE_SIZE + 5] ^= 0x01
+        with open(self.path, 'wb') as f:
+            f.write(encrypted)
+
+        with self.assertRaises(InvalidTag):
+            self.file_ops.decrypt_file(self.path)
+        self.assertEqual(self.read(), encrypted)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+
+    def test_wrong_key_rejected(self):
+        """Test another instance's key cannot decrypt the file."""
+        self.file_ops.encrypt_file(self.path)
+        with self.assertRaises(InvalidTag):
+            FileOperations().decrypt_file(self.path)
+
+    def test_empty_file_skipped(self):
+        """Test an empty file is rejected rather than encrypted."""
+        open(self.path, 'wb').close()
+        self.assertFalse(self.file_ops.encrypt_file(self.path))
+        self.assertEqual(self.read(), b"")
+
+    def test_fernet_round_trip(self):
+        """Test the Fernet fallback still round-trips."""
+        file_ops = FileOperations(use_fernet=True)
+        self.assertTrue(file_ops.encrypt_file(self.path))
+        self.assertNotEqual(self.read(), self.PLAINTEXT)
+        self.assertTrue(file_ops.decrypt_file(self.path))
+        self.assertEqual(self.read(), self.PLAINTEXT)
+
+class TestFileDiff(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.file_ops = FileOperations()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name, text):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def test_identical_files(self):
+        """Test identical files report no differences."""
+        first = self.write("a.txt", "one\ntwo\n")
+        second = self.write("b.txt", "one\ntwo\n")
+        self.assertTrue(self.file_ops.files_identical(first, second))
+        self.assertEqual(self.file_ops.file_diff(first, second), [])
+
+    def test_same_size_different_content(self):
+        """Test files of equal size but different bytes are not identical."""
+        first = self.write("a.txt", "one\ntwo\n")
+        second = self.write("b.txt", "one\ntwX\n")
+        self.assertFalse(self.file_ops.files_identical(first, second))
+
+    def test_unified_diff(self):
+        """Test differing files produce a unified diff with headers and hunks."""
+        first = self.write("a.txt", "one\ntwo\nthree\n")
+        second = self.write("b.txt", "one\n2\nthree\nfour\n")
+        self.assertEqual(self.file_ops.file_diff(first, second), [
+            f"--- {first}\n", f"+++ {second}\n", "@@ -1,3 +1,4 @@\n",
+            " one\n", "-two\n", "+2\n", " three\n", "+four\n",
+        ])
+
+if __name__ == '__main__':
+    unittest.main()
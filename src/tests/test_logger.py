@@ -0,0 +1,49 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+from src.utils.logger import Logger
+
+class TestLoggerLog(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.logger = Logger(log_file=os.path.join(self.temp_dir.name, "test.log"))
+
+    def tearDown(self):
+        self.logger.stop()
+        for handler in list(self.logger.logger.handlers):
+            self.logger.logger.removeHandler(handler)
+        self.temp_dir.cleanup()
+
+    def emitted(self, *args, **kwargs):
+        """Call Logger.log and return the level and fully formatted message it logs."""
+        with patch.object(self.logger.logger, 'log') as mock_log:
+            self.logger.log(*args, **kwargs)
+        level, message, *message_args = mock_log.call_args.args
+        return level, message % tuple(message_args) if message_args else message
+
+    def test_context_positional(self):
+        """Test context passed as the third positional argument is logged as context."""
+        self.assertEqual(self.emitted('warning', "Scan slow", {"sample": "a.exe"}),
+                         (logging.WARNING, 'Scan slow | context: {"sample":"a.exe"}'))
+
+    def test_context_keyword(self):
+        """Test context passed by keyword gives the same message."""
+        self.assertEqual(self.emitted('info', "Scan slow", context={"sample": "a.exe"}),
+                         (logging.INFO, 'Scan slow | context: {"sample":"a.exe"}'))
+
+    def test_percent_in_message_with_context(self):
+        """Test a literal % in the message survives when context is added."""
+        self.assertEqual(self.emitted('info', "100% done", {"step": 3})[1], '100% done | context: {"step":3}')
+
+    def test_args_formatted_lazily(self):
+        """Test log_event passes its args through for lazy formatting."""
+        with patch.object(self.logger.logger, 'log') as mock_log:
+            self.logger.log_event("Parsed %d entries", 4)
+        mock_log.assert_called_once_with(logging.INFO, "Parsed %d entries", 4)
+
+if __name__ == '__main__':
+    unittest.main()
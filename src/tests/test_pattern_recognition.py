@@ -0,0 +1,45 @@
+import re
+import unittest
+from src.data_processing.pattern_recognition import PatternRecognizer, literals_never_overlap
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+
+class TestLiteralDispatch(unittest.TestCase):
+
+    def test_disjoint_literals_never_overlap(self):
+        """Test literals that share no prefix/suffix are accepted."""
+        self.assertTrue(literals_never_overlap(["virus", "trojan", "payload"]))
+
+    def test_contained_literal_overlaps(self):
+        """Test a literal contained in another is rejected."""
+        self.assertFalse(literals_never_overlap(["troj", "trojan"]))
+
+    def test_suffix_prefix_overlap(self):
+        """Test a suffix of one literal that starts another is rejected."""
+        self.assertFalse(literals_never_overlap(["abc", "cde"]))
+        self.assertFalse(literals_never_overlap(["cde", "abc"]))
+
+    def test_literal_counts_match_alternation(self):
+        """Test the str.count path counts exactly what the combined regex finds."""
+        strings = ["run virus trojan", "virusvirus", "trojan /c payload", "nothing here"]
+        patterns = ["virus", "trojan", "payload"]
+        recognizer = PatternRecognizer({"strings": strings})
+        recognizer.add_patterns(patterns)
+        counts = recognizer.recognize_multiple_patterns()
+        self.assertIsNotNone(recognizer._literals)  # The literal path was taken
+
+        combined = re.compile("|".join(f"({re.escape(p)})" for p in patterns))
+        expected = {}
+        for match in combined.finditer("\x00".join(strings)):
+            expected[match.group()] = expected.get(match.group(), 0) + 1
+        self.assertEqual(counts, expected)
+
+    def test_overlapping_literals_use_regex(self):
+        """Test overlapping literals fall back to the regex path."""
+        recognizer = PatternRecognizer({"strings": ["abcde"]})
+        recognizer.add_patterns(["abc", "cde"])
+        counts = recognizer.recognize_multiple_patterns()
+        self.assertIsNone(recognizer._literals)
+        self.assertEqual(counts, {"abc": 1})
+
+if __name__ == '__main__':
+    unittest.main()
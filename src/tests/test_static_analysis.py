@@ -0,0 +1,108 @@
+import hashlib
+import math
+import os
+import re
+import tempfile
+import unittest
+from unittest.mock import patch
+import pyclamd
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+from src.data_collection import static_analysis
+from src.data_collection.static_analysis import StaticAnalyzer, get_clamd, scan_many
+
+def reference_scan(data: bytes, min_length: int = 4):
+    """Hash, strings and entropy computed the straightforward way, one pass each."""
+    strings = [s.decode('ascii') for s in re.findall(rb'[\x20-\x7e]{%d,}' % min_length, data)]
+    entropy = 0.0
+    for count in (data.count(bytes([b])) for b in range(256)):
+        if count:
+            p_x = count / len(data)
+            entropy -= p_x * math.log2(p_x)
+    return hashlib.sha256(data).hexdigest(), strings, entropy
+
+class TestScanSample(unittest.TestCase):
+
+    SAMPLE = (b'MZ\x90\x00kernel32.dll\x00\x01ab\x02CreateFileA\xff\xfe'
+              b'spans several chunks of the scan\x00\x7fhttp://example.com/x\n\tend~')
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.SAMPLE)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def assertMatchesReference(self, analyzer, data):
+        file_hash, strings, entropy = reference_scan(data)
+        self.assertEqual(analyzer.analysis_results["file_hash"], file_hash)
+        self.assertEqual(analyzer.analysis_results["strings"], strings)
+        self.assertAlmostEqual(analyzer.analysis_results["file_entropy"], entropy)
+
+    def test_single_chunk(self):
+        """Test the fused scan matches separate hash, regex and entropy passes."""
+        analyzer = StaticAnalyzer(self.path)
+        analyzer.scan_sample()
+        self.assertMatchesReference(analyzer, self.SAMPLE)
+
+    def test_runs_across_chunks(self):
+        """Test printable runs cut by chunk boundaries are joined, whatever the chunk size."""
+        for chunk_size in (1, 3, 7, 16):
+            with self.subTest(chunk_size=chunk_size), \
+                    patch('src.data_collection.static_analysis.SCAN_CHUNK_SIZE', chunk_size):
+                analyzer = StaticAnalyzer(self.path)
+                analyzer.scan_sample()
+                self.assertMatchesReference(analyzer, self.SAMPLE)
+
+    def test_mapped_sample(self):
+        """Test scanning the shared mmap buffer gives the same results as reading the file."""
+        analyzer = StaticAnalyzer(self.path)
+        analyzer.load_sample()
+        try:
+            analyzer.scan_sample()
+        finally:
+            analyzer.release_sample()
+        self.assertMatchesReference(analyzer, self.SAMPLE)
+
+    def test_empty_file(self):
+        """Test an empty sample hashes to the empty digest with no strings and zero entropy."""
+        open(self.path, 'wb').close()
+        analyzer = StaticAnalyzer(self.path)
+        analyzer.load_sample()
+        try:
+            analyzer.scan_sample()
+        finally:
+            analyzer.release_sample()
+        self.assertEqual(analyzer.analysis_results["file_hash"], hashlib.sha256(b'').hexdigest())
+        self.assertEqual(analyzer.analysis_results["strings"], [])
+        self.assertEqual(analyzer.analysis_results["file_entropy"], 0.0)
+
+    def test_wrappers(self):
+        """Test calculate_file_hash and analyze_strings fill in the scan results."""
+        file_hash, strings, _ = reference_scan(self.SAMPLE)
+        self.assertEqual(StaticAnalyzer(self.path).calculate_file_hash(), file_hash)
+        analyzer = StaticAnalyzer(self.path)
+        analyzer.analyze_strings()
+        self.assertEqual(analyzer.analysis_results["strings"], strings)
+
+class TestClamdUnavailable(unittest.TestCase):
+
+    def setUp(self):
+        static_analysis._clamd = None  # Drop any shared connection from earlier tests
+
+    def test_no_daemon(self):
+        """Test a missing ClamAV daemon degrades to no connection and no matches."""
+        error = pyclamd.ConnectionError("Could not find clamd unix socket")
+        with patch('src.data_collection.static_analysis.pyclamd.ClamdUnixSocket', side_effect=error):
+            self.assertIsNone(get_clamd())
+            self.assertEqual(scan_many(["sample.exe"]), {})
+
+    def test_daemon_not_answering(self):
+        """Test a socket that refuses the ping also counts as no daemon."""
+        with patch('src.data_collection.static_analysis.pyclamd.ClamdUnixSocket') as mock_socket:
+            mock_socket.return_value.ping.side_effect = OSError("Connection refused")
+            self.assertIsNone(get_clamd())
+            self.assertEqual(scan_many(["sample.exe"]), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import networkx as nx
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
+
+try:
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")  # No display is needed to build the window
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtTest import QTest
+    from src.ui.main_window import MainWindow, ZSTD_MAGIC
+    from src.ui.dialogs import ProgressDialog, PROGRESS_COALESCE_MS
+except ImportError:
+    QApplication = None
+
+@unittest.skipIf(QApplication is None, "PyQt5 is not installed")
+class TestStateFiles(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the application and one window for the whole class."""
+        cls.app = QApplication.instance() or QApplication([])
+        cls.window = MainWindow()
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        graph = nx.Graph()
+        graph.add_node("CreateFileA", count=5)
+        graph.add_node("WriteFile", count=3)
+        graph.add_edge("CreateFileA", "WriteFile")
+        self.window.set_graph(graph)
+        self.window.node_info_display.setPlainText("CreateFileA\nWriteFile")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def round_trip(self, file_name):
+        """Save the state to file_name, clear the window and load it back."""
+        path = os.path.join(self.temp_dir.name, file_name)
+        with patch('src.ui.main_window.QMessageBox.critical') as mock_critical:
+            with patch('src.ui.main_window.QFileDialog.getSaveFileName', return_value=(path, "")):
+                self.window.save_state()
+            self.window.set_graph(nx.Graph())
+            self.window.node_info_display.clear()
+            with patch('src.ui.main_window.QFileDialog.getOpenFileName', return_value=(path, "")):
+                self.window.load_state()
+            mock_critical.assert_not_called()
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def assertStateRestored(self):
+        self.assertEqual(dict(self.window.graph.nodes(data='count')), {"CreateFileA": 5, "WriteFile": 3})
+        self.assertTrue(self.window.graph.has_edge("CreateFileA", "WriteFile"))
+        self.assertEqual(self.window.node_info_display.toPlainText(), "CreateFileA\nWriteFile")
+
+    def test_zstd_round_trip(self):
+        """Test a .zst state file is zstd-compressed and restores the graph."""
+        data = self.round_trip("state.json.zst")
+        self.assertTrue(data.startswith(ZSTD_MAGIC))
+        self.assertStateRestored()
+
+    def test_json_round_trip(self):
+        """Test a .json state file stays plain JSON and restores the graph."""
+        data = self.round_trip("state.json")
+        self.assertTrue(data.startswith(b"{"))
+        self.assertStateRestored()
+
+@unittest.skipIf(QApplication is None, "PyQt5 is not installed")
+class TestProgressDialog(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.dialog = ProgressDialog()
+        self.painted = []
+        set_value = self.dialog.setValue
+        self.dialog.setValue = lambda value: (self.painted.append(value), set_value(value))
+
+    def test_burst_repaints_once(self):
+        """Test a burst of updates repaints once, with the latest value."""
+        for value in range(60):
+            self.dialog.update_progress(value + 0.5)
+        self.assertEqual(self.painted, [])
+        QTest.qWait(PROGRESS_COALESCE_MS * 3)
+        self.assertEqual(self.painted, [59])
+        self.assertEqual(self.dialog.value(), 59)
+
+    def test_completion_shown_at_once(self):
+        """Test reaching 100 repaints immediately and drops the pending value."""
+        self.dialog.update_progress(40)
+        self.dialog.update_progress(100)
+        QTest.qWait(PROGRESS_COALESCE_MS * 3)
+        self.assertEqual(self.painted, [100])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 from unittest.mock import patch, MagicMock
+from . import setUpModule, tearDownModule  # Silence logging for the whole module
 from src.visualization.graph_builder import GraphBuilder
 from src.visualization.visualizer import Visualizer
 import time
@@ -7,15 +8,16 @@ import networkx as nx
 
 class TestVisualization(unittest.TestCase):
 
-    def setUp(self):
-        """Set up necessary objects for testing the visualization components."""
-        self.graph_builder = GraphBuilder()
-        self.visualizer = Visualizer()
+    @classmethod
+    def setUpClass(cls):
+        """Create the visualization components once for the whole class."""
+        cls.graph_builder = GraphBuilder()
+        cls.visualizer = Visualizer()
 
-    def tearDown(self):
-        """Clean up after each test."""
-        del self.graph_builder
-        del self.visualizer
+    def setUp(self):
+        """Reset the graphs the components accumulate so tests stay independent."""
+        self.graph_builder.graph = nx.Graph()
+        self.visualizer.graph = nx.Graph()
 
     @patch('src.visualization.graph_builder.nx')
     def test_build_graph(self, mock_networkx):
@@ -27,11 +29,12 @@ class TestVisualization(unittest.TestCase):
         self.graph_builder.build_graph(pattern_counts)
 
         mock_networkx.Graph.assert_called_once()
-        mock_graph.add_node.assert_any_call('node1', count=5, x=0, y=0)
-        mock_graph.add_node.assert_any_call('node2', count=3, x=0, y=0)
-        mock_graph.add_node.assert_any_call('node3', count=2, x=0, y=0)
-        mock_graph.add_edge.assert_any_call('node1', 'node2')
-        mock_graph.add_edge.assert_any_call('node2', 'node3')
+        mock_graph.add_nodes_from.assert_called_once_with([
+            ('node1', {'count': 5, 'x': 0, 'y': 0}),
+            ('node2', {'count': 3, 'x': 0, 'y': 0}),
+            ('node3', {'count': 2, 'x': 0, 'y': 0}),
+        ])
+        mock_graph.add_edges_from.assert_called_once_with([('node1', 'node2'), ('node2', 'node3')])
 
     def test_build_empty_graph(self):
         """Test graph builder with empty pattern counts."""
@@ -140,7 +143,7 @@ class TestVisualization(unittest.TestCase):
 
         with patch('src.utils.logger.Logger.log_event') as mock_log_event:
             self.visualizer.render_graph(self.graph_builder.graph, show=False)
-            mock_log_event.assert_called_with("Graph rendered and saved to graph_output.png")
+            mock_log_event.assert_called_with("Graph rendered and saved to %s", "graph_output.png")
 
     def test_empty_graph_rendering(self):
         """Test rendering an empty graph."""
@@ -148,5 +151,58 @@ class TestVisualization(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.visualizer.render_graph(empty_graph, show=False)
 
+class TestLayoutCache(unittest.TestCase):
+
+    def setUp(self):
+        """Give each test its own visualizer over a small path graph."""
+        self.visualizer = Visualizer()
+        self.visualizer.set_graph(nx.path_graph(5))
+
+    def test_repeat_layout_is_cached(self):
+        """Test asking for the same layout twice computes it once."""
+        first = self.visualizer.get_layout('circular')
+        with patch('src.visualization.visualizer.nx.circular_layout') as mock_layout:
+            self.assertIs(self.visualizer.get_layout('circular'), first)
+            mock_layout.assert_not_called()
+
+    def test_layouts_cached_separately(self):
+        """Test each layout kind has its own cache entry."""
+        spring = self.visualizer.get_layout('spring')
+        circular = self.visualizer.get_layout('circular')
+        self.assertIsNot(spring, circular)
+        self.assertIs(self.visualizer.get_layout('spring'), spring)
+
+    def test_in_place_change_invalidates(self):
+        """Test nodes and edges added straight to the graph force a new layout."""
+        first = self.visualizer.get_layout('circular')
+        self.visualizer.graph.add_edge(4, 5)
+        second = self.visualizer.get_layout('circular')
+        self.assertIsNot(second, first)
+        self.assertEqual(set(second), set(range(6)))
+
+        # An edge between two existing nodes leaves the node count unchanged
+        soa_edges = len(self.visualizer.soa.edge_src)
+        self.visualizer.graph.add_edge(0, 4)
+        self.assertIsNot(self.visualizer.get_layout('circular'), second)
+        self.assertEqual(len(self.visualizer.soa.edge_src), soa_edges + 1)
+
+    def test_set_graph_resets_cache(self):
+        """Test a new graph of the same size is laid out afresh."""
+        first = self.visualizer.get_layout('circular')
+        self.visualizer.set_graph(nx.path_graph(['a', 'b', 'c', 'd', 'e']))
+        second = self.visualizer.get_layout('circular')
+        self.assertIsNot(second, first)
+        self.assertEqual(set(second), {'a', 'b', 'c', 'd', 'e'})
+
+    def test_update_graph_keeps_unmoved_nodes(self):
+        """Test update_graph only moves nodes touched by the change."""
+        pos = self.visualizer.get_layout('spring')
+        kept = {node: tuple(pos[node]) for node in (0, 1, 2)}
+        self.visualizer.update_graph(added_nodes=[5], added_edges=[(4, 5)])
+        updated = self.visualizer.get_layout('spring')
+        self.assertIn(5, updated)
+        for node, xy in kept.items():
+            self.assertEqual(tuple(updated[node]), xy)
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,8 +9,9 @@ __all__ = ['main_window', 'dialogs']
 
 import logging
 
-# Configure logging for the UI module
-logging.basicConfig(level=logging.INFO)
+# Configure logging for the UI module, unless the application (or a test run) already has
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 logger.info("User Interface module initialized.")
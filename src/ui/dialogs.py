@@ -12,9 +12,14 @@ from PyQt5.QtWidgets import (
     QSpinBox,
     QTextEdit,
     QFileDialog,
+    QListWidget,
 )
+from PyQt5.QtCore import QTimer
 import sys
 
+# Progress updates arriving within this window repaint the dialog once
+PROGRESS_COALESCE_MS = 50
+
 class InfoDialog(QDialog):
     """Dialog to display information about the application."""
     def __init__(self, parent=None):
@@ -99,12 +104,31 @@ class ProgressDialog(QProgressDialog):
         self.setWindowTitle("Progress")
         self.setModal(True)
         self.setValue(0)
+        # Each setValue repaints, so updates are coalesced and only the latest one is shown
+        self._pending_value = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_COALESCE_MS)
+        self._progress_timer.timeout.connect(self.flush_progress)
 
     def update_progress(self, value):
         """Update the progress dialog with the current value."""
-        self.setValue(value)
         if value >= 100:
+            # Completion is shown at once
+            self._progress_timer.stop()
+            self._pending_value = None
+            self.setValue(int(value))
             self.close()
+            return
+        self._pending_value = int(value)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def flush_progress(self):
+        """Show the latest queued progress value if it changed the whole percent."""
+        if self._pending_value is not None and self._pending_value != self.value():
+            self.setValue(self._pending_value)
+        self._pending_value = None
 
 
 class SettingsDialog(QDialog):
@@ -227,9 +251,9 @@ class MultiFileInputDialog(QDialog):
         self.setWindowTitle("Select Files for Analysis")
         self.setGeometry(100, 100, 400, 300)
 
+        self._files = []  # Selected paths; the widget below only displays them
         layout = QVBoxLayout()
-        self.file_list = QTextEdit()
-        self.file_list.setReadOnly(True)
+        self.file_list = QListWidget()
         layout.addWidget(self.file_list)
 
         browse_button = QPushButton("Browse")
@@ -246,11 +270,13 @@ class MultiFileInputDialog(QDialog):
         """Open a file dialog to select multiple files."""
         files, _ = QFileDialog.getOpenFileNames(self, "Select Malware Files", "", "All Files (*.*)")
         if files:
-            self.file_list.setPlainText("\n".join(files))
+            self._files = list(files)
+            self.file_list.clear()
+            self.file_list.addItems(files)
 
     def get_selected_files(self):
         """Return the list of selected files."""
-        return self.file_list.toPlainText().splitlines()
+        return list(self._files)
 
 
 # Sample Usage
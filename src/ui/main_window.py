@@ -1,26 +1,57 @@
 import sys
+from itertools import islice
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QToolBar,
                              QFileDialog, QMessageBox, QVBoxLayout, QWidget,
                              QLabel, QStatusBar, QComboBox, QLineEdit, QPushButton, QTextEdit)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QObject, pyqtSignal
 from PyQt5.QtGui import QIcon
-from visualizer import Visualizer
 import networkx as nx
 import logging
-import json
+import orjson
+
+try:
+    import zstandard  # Optional compression for saved application state
+except ImportError:
+    zstandard = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# The node search runs only after typing has paused for this long
+SEARCH_DEBOUNCE_MS = 200
+# At most this many matching nodes are listed; the scan stops once it has them
+SEARCH_RESULT_LIMIT = 200
+# Saved state files starting with this frame magic are zstd-compressed
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+STATE_FILE_FILTER = "Compressed State (*.json.zst);;JSON Files (*.json)"
+
+# Status messages arriving within this window repaint the status label once
+STATUS_COALESCE_MS = 50
+
+class StatusEmitter(QObject):
+    """Carries status messages from any thread to the GUI thread."""
+    status = pyqtSignal(str)
+
+class StatusLogHandler(logging.Handler):
+    """Logging handler that forwards records as status messages instead of touching widgets."""
+    def __init__(self, emitter, level=logging.WARNING):
+        super().__init__(level)
+        self.emitter = emitter
+
+    def emit(self, record):
+        self.emitter.status.emit(record.getMessage())
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Visual Malware Signature Generator")
         self.setGeometry(100, 100, 800, 600)
 
-        self.visualizer = Visualizer()
+        self._visualizer = None  # Created on first use, see the visualizer property
+        self._toolbar_built = False
         self.graph = nx.Graph()
+        self.index_node_names()
         
         # Central widget and layout
         self.central_widget = QWidget(self)
@@ -46,9 +77,16 @@ class MainWindow(QMainWindow):
         # Search functionality
         self.search_bar = QLineEdit(self)
         self.search_bar.setPlaceholderText("Search nodes...")
-        self.search_bar.textChanged.connect(self.search_node)
+        self.search_bar.textChanged.connect(self.schedule_search)
         self.layout.addWidget(self.search_bar)
 
+        # Restarted on every keystroke, so only the last query is actually searched
+        self._pending_query = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.run_pending_search)
+
         # Node information display
         self.node_info_display = QTextEdit(self)
         self.node_info_display.setReadOnly(True)
@@ -68,9 +106,6 @@ class MainWindow(QMainWindow):
         self.clear_selection_button.clicked.connect(self.clear_selection)
         self.layout.addWidget(self.clear_selection_button)
 
-        # Add toolbar
-        self.init_toolbar()
-        
         # Label for instructions
         self.label = QLabel("Select a graph from the dropdown or load a new graph.")
         self.layout.addWidget(self.label)
@@ -79,11 +114,55 @@ class MainWindow(QMainWindow):
         self.status_indicator = QLabel("Status: Ready")
         self.layout.addWidget(self.status_indicator)
 
+        # Application log records are handled on whichever thread logged them, so they reach the
+        # label through a queued connection and the slot always runs on the GUI thread
+        self._pending_status = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(STATUS_COALESCE_MS)
+        self._status_timer.timeout.connect(self.flush_status)
+        self._status_emitter = StatusEmitter(self)
+        self._status_emitter.status.connect(self.queue_status, Qt.QueuedConnection)
+        self._status_log_handler = StatusLogHandler(self._status_emitter)
+        logging.getLogger('MalwareSignatureGenerator').addHandler(self._status_log_handler)
+
         # Theme switch button
         self.theme_switch_button = QPushButton("Switch to Dark Theme", self)
         self.theme_switch_button.clicked.connect(self.switch_theme)
         self.layout.addWidget(self.theme_switch_button)
 
+    @property
+    def visualizer(self):
+        """The Visualizer, imported and created on first use so plotting libraries do not slow startup."""
+        if self._visualizer is None:
+            from visualization.visualizer import Visualizer
+            self._visualizer = Visualizer()
+        return self._visualizer
+
+    def queue_status(self, message):
+        """Keep only the latest status message and repaint once the coalescing interval ends."""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def flush_status(self):
+        """Show the latest queued status message."""
+        if self._pending_status is not None:
+            self.status_indicator.setText(f"Status: {self._pending_status}")
+            self._pending_status = None
+
+    def closeEvent(self, event):
+        """Stop forwarding log records to widgets that are about to be destroyed."""
+        logging.getLogger('MalwareSignatureGenerator').removeHandler(self._status_log_handler)
+        super().closeEvent(event)
+
+    def showEvent(self, event):
+        """Build the toolbar when the window is first shown rather than during construction."""
+        if not self._toolbar_built:
+            self.init_toolbar()
+            self._toolbar_built = True
+        super().showEvent(event)
+
     def init_toolbar(self):
         """Initialize the toolbar with actions."""
         toolbar = QToolBar("Main Toolbar")
@@ -134,8 +213,7 @@ class MainWindow(QMainWindow):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Graph File", "", "Graph Files (*.graph *.gml *.xml)")
         if file_name:
             try:
-                self.graph = nx.read_gml(file_name)  # or appropriate format
-                self.visualizer.set_graph(self.graph)
+                self.set_graph(nx.read_gml(file_name))  # or appropriate format
                 self.update_graph_selector()
                 self.status_bar.showMessage(f"Loaded graph from {file_name}")
                 self.status_indicator.setText("Status: Graph Loaded")
@@ -172,7 +250,7 @@ class MainWindow(QMainWindow):
 
     def refresh_graph(self):
         """Refresh the graph visualization."""
-        self.visualizer.visualize_graph("Malware Signature Patterns")
+        self.visualizer.render("Malware Signature Patterns")  # Summarizes graphs too large to plot per node
         self.status_bar.showMessage("Graph refreshed")
         self.status_indicator.setText("Status: Graph Refreshed")
         logger.info("Graph visualization refreshed.")
@@ -200,12 +278,35 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Invalid layout type selected.")
         self.refresh_graph()
 
+    def set_graph(self, graph):
+        """Make graph the current graph, dropping everything derived from the previous one."""
+        self.graph = graph
+        self.index_node_names()
+        self.visualizer.set_graph(self.graph)
+
+    def index_node_names(self):
+        """Cache the node names and their lower-cased forms so searches do not recompute them."""
+        self._node_names = [str(node) for node in self.graph.nodes]
+        self._node_names_lc = [name.lower() for name in self._node_names]
+
+    def schedule_search(self, text):
+        """Remember the query and (re)start the debounce timer."""
+        self._pending_query = text
+        self._search_timer.start()
+
+    def run_pending_search(self):
+        """Search for the last query typed once the debounce interval has elapsed."""
+        self.search_node(self._pending_query)
+
     def search_node(self, text):
         """Search for a node in the graph."""
         if text:
-            found_nodes = [node for node in self.graph.nodes if text.lower() in str(node).lower()]
+            query = text.lower()
+            matches = (name for name, lowered in zip(self._node_names, self._node_names_lc) if query in lowered)
+            found_nodes = list(islice(matches, SEARCH_RESULT_LIMIT))
             if found_nodes:
-                self.node_info_display.setPlainText("\n".join(found_nodes))
+                more = "\n…" if len(found_nodes) == SEARCH_RESULT_LIMIT else ""
+                self.node_info_display.setPlainText("\n".join(found_nodes) + more)
             else:
                 self.node_info_display.setPlainText("No nodes found.")
         else:
@@ -214,6 +315,7 @@ class MainWindow(QMainWindow):
     def clear_selection(self):
         """Clear the current node selection."""
         self.search_bar.clear()
+        self._search_timer.stop()
         self.node_info_display.clear()
         self.status_bar.showMessage("Selection cleared.")
         self.status_indicator.setText("Status: Selection Cleared")
@@ -221,14 +323,21 @@ class MainWindow(QMainWindow):
     def save_state(self):
         """Save the current application state to a file."""
         state = {
-            "graph": self.graph,  # Consider serialization method
+            "graph": nx.node_link_data(self.graph),
             "selected_nodes": list(self.node_info_display.toPlainText().splitlines())  # Example
         }
-        file_name, _ = QFileDialog.getSaveFileName(self, "Save State", "", "JSON Files (*.json)")
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save State", "", STATE_FILE_FILTER)
         if file_name:
             try:
-                with open(file_name, 'w') as f:
-                    json.dump(state, f)  # Serialize your graph properly
+                # Non-JSON attribute values (e.g. sets) are written as strings
+                data = orjson.dumps(state, default=str)
+                if file_name.endswith('.zst'):
+                    if zstandard is None:
+                        raise RuntimeError("the zstandard package is required for .zst state files")
+                    # Level 3 on all cores: node-link JSON shrinks several times for little CPU
+                    data = zstandard.ZstdCompressor(level=3, threads=-1).compress(data)
+                with open(file_name, 'wb') as f:
+                    f.write(data)
                 self.status_bar.showMessage(f"State saved to {file_name}")
                 self.status_indicator.setText("Status: State Saved")
                 logger.info(f"Application state saved to {file_name}")
@@ -238,14 +347,19 @@ class MainWindow(QMainWindow):
 
     def load_state(self):
         """Load the application state from a file."""
-        file_name, _ = QFileDialog.getOpenFileName(self, "Load State", "", "JSON Files (*.json)")
+        file_name, _ = QFileDialog.getOpenFileName(self, "Load State", "", STATE_FILE_FILTER)
         if file_name:
             try:
-                with open(file_name, 'r') as f:
-                    state = json.load(f)
-                    # Deserialize graph here, implement the proper loading mechanism
-                    # self.graph = deserialize_graph(state["graph"])  # Placeholder
-                    self.node_info_display.setPlainText("\n".join(state.get("selected_nodes", [])))
+                with open(file_name, 'rb') as f:
+                    data = f.read()
+                if data.startswith(ZSTD_MAGIC):
+                    if zstandard is None:
+                        raise RuntimeError("the zstandard package is required for .zst state files")
+                    data = zstandard.ZstdDecompressor().decompress(data)
+                state = orjson.loads(data)
+                if "graph" in state:
+                    self.set_graph(nx.node_link_graph(state["graph"]))
+                self.node_info_display.setPlainText("\n".join(state.get("selected_nodes", [])))
                 self.status_bar.showMessage(f"State loaded from {file_name}")
                 self.status_indicator.setText("Status: State Loaded")
                 logger.info(f"Application state loaded from {file_name}")
@@ -3,20 +3,48 @@ import os
 import smtplib
 import gzip
 import shutil
-import json
 import time
-import threading
-from logging.handlers import RotatingFileHandler, Filter
+import orjson
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from queue import Queue
 
-class CustomFilter(Filter):
-    """Custom filter to allow filtering of log messages."""
-    def __init__(self, level=logging.DEBUG):
-        super().__init__()
-        self.level = level
+try:
+    import zstandard  # Optional multi-threaded compression of rotated logs
+except ImportError:
+    zstandard = None
 
-    def filter(self, record):
-        return record.levelno >= self.level
+COMPRESS_CHUNK_SIZE = 1024 * 1024  # Read/write size when compressing old log files
+
+# Levels accepted by Logger.log, mapped to their logging module values
+_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+class JsonArg:
+    """Log argument rendered as JSON by orjson, only when the record is formatted."""
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        # Values orjson cannot encode natively (datetimes aside) are written with str()
+        return orjson.dumps(self.value, default=str).decode()
+
+class NotificationHandler(logging.Handler):
+    """Handler that passes error records to a notification callback."""
+    def __init__(self, notify, level=logging.ERROR):
+        super().__init__(level)
+        self.notify = notify
+
+    def emit(self, record):
+        # Records about the notification itself are not notified again
+        if not getattr(record, 'notification', False):
+            self.notify(record.getMessage())
 
 class Logger:
     """Logger class to handle application logging."""
@@ -26,7 +54,8 @@ class Logger:
                  min_log_level=logging.DEBUG, retention_days=30):
         """Initialize the logger with file and console handlers."""
         self.logger = logging.getLogger('MalwareSignatureGenerator')
-        self.logger.setLevel(logging.DEBUG)
+        # Records below the minimum level are dropped by the logger itself, before they are queued
+        self.logger.setLevel(min_log_level if min_log_level is not None else logging.DEBUG)
 
         # Create a rotating file handler
         self.log_file = log_file
@@ -39,54 +68,43 @@ class Logger:
         file_handler.setFormatter(log_format)
         console_handler.setFormatter(log_format)
 
-        # Add custom filter for minimum log level
         if min_log_level is not None:
-            custom_filter = CustomFilter(level=min_log_level)
-            file_handler.addFilter(custom_filter)
-            console_handler.addFilter(custom_filter)
-
-        # Add handlers to the logger
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+            file_handler.setLevel(min_log_level)
+            console_handler.setLevel(min_log_level)
 
         # Email notification flag
         self.email_notifications = email_notifications
+        handlers = [file_handler, console_handler]
+        if email_notifications:
+            handlers.append(NotificationHandler(self.send_error_notification))
 
-        # Initialize queue for asynchronous logging
+        # Callers only enqueue records; the listener thread blocks on the queue and
+        # runs the file, console and notification handlers
         self.log_queue = Queue()
-        self.is_logging = True
-        threading.Thread(target=self.process_log_queue, daemon=True).start()
-
-    def log(self, level, message, context=None):
-        """Log a message at the specified level with optional context."""
-        log_message = {
-            "level": level,
-            "message": message,
-            "context": context if context else {},
-            "timestamp": time.strftime('%Y-%m-%d %H:%M:%S')
-        }
-        self.log_queue.put(log_message)
-
-    def process_log_queue(self):
-        """Process log messages from the queue asynchronously."""
-        while self.is_logging:
-            while not self.log_queue.empty():
-                log_message = self.log_queue.get()
-                if log_message["level"] == 'debug':
-                    self.logger.debug(json.dumps(log_message))
-                elif log_message["level"] == 'info':
-                    self.logger.info(json.dumps(log_message))
-                elif log_message["level"] == 'warning':
-                    self.logger.warning(json.dumps(log_message))
-                elif log_message["level"] == 'error':
-                    self.logger.error(json.dumps(log_message))
-                    if self.email_notifications:
-                        self.send_error_notification(log_message["message"])
-                elif log_message["level"] == 'critical':
-                    self.logger.critical(json.dumps(log_message))
-                    if self.email_notifications:
-                        self.send_error_notification(log_message["message"])
-                self.log_queue.task_done()
+        self.logger.addHandler(QueueHandler(self.log_queue))
+        self._listener = QueueListener(self.log_queue, *handlers, respect_handler_level=True)
+        self._listener.start()
+
+    def log(self, level, message, context=None, *args):
+        """Log a message at the specified level with optional context.
+
+        Any args are %-formatted into the message only when it is actually emitted.
+        """
+        if context:
+            if not args:
+                # The message becomes a format string, so its own % signs must stay literal
+                message = message.replace('%', '%%')
+            message = f"{message} | context: %s"
+            args = args + (JsonArg(context),)
+        self.logger.log(_LEVELS.get(level, logging.INFO), message, *args)
+
+    def log_event(self, message, *args):
+        """Log an informational event, formatting args lazily."""
+        self.log('info', message, None, *args)
+
+    def stop(self):
+        """Flush queued records and stop the listener thread."""
+        self._listener.stop()
 
     def send_error_notification(self, message):
         """Send an email notification for critical errors."""
@@ -100,23 +118,31 @@ class Logger:
                 server.starttls()
                 server.login(sender, 'your_email_password')  # Update with your email password
                 server.sendmail(sender, receiver, f"Subject: {subject}\n\n{body}")
-                self.logger.info("Error notification sent to %s", receiver)
+                self.logger.info("Error notification sent to %s", receiver, extra={'notification': True})
         except Exception as e:
-            self.logger.error("Failed to send error notification: %s", str(e))
+            self.logger.error("Failed to send error notification: %s", str(e), extra={'notification': True})
 
     def compress_old_log_files(self):
         """Compress old log files to save space."""
         if os.path.exists(self.log_file):
             with open(self.log_file, 'rb') as f_in:
-                with gzip.open(f"{self.log_file}.gz", 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
+                if zstandard is not None:
+                    # zstd compresses blocks on every core, unlike gzip's single stream
+                    cctx = zstandard.ZstdCompressor(level=10, threads=os.cpu_count() or 1)
+                    with open(f"{self.log_file}.zst", 'wb') as f_out:
+                        cctx.copy_stream(f_in, f_out, read_size=COMPRESS_CHUNK_SIZE, write_size=COMPRESS_CHUNK_SIZE)
+                else:
+                    # Level 6 is zlib's default: much faster than gzip.open's 9 for a few percent in size
+                    with gzip.open(f"{self.log_file}.gz", 'wb', compresslevel=6) as f_out:
+                        shutil.copyfileobj(f_in, f_out, length=COMPRESS_CHUNK_SIZE)
             os.remove(self.log_file)  # Remove the original log file after compression
 
     def adjust_log_level(self, level):
         """Dynamically adjust the logging level."""
         self.logger.setLevel(level)
-        for handler in self.logger.handlers:
-            handler.setLevel(level)
+        for handler in self._listener.handlers:
+            if not isinstance(handler, NotificationHandler):
+                handler.setLevel(level)
         self.logger.info(f"Log level adjusted to: {level}")
 
     def delete_old_logs(self):
@@ -1,94 +1,106 @@
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import networkx as nx
 import logging
 import os
+from itertools import chain
 from typing import Dict, List
+from visualization.visualizer import Visualizer, scatter_cls
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+CSV_CHUNK_SIZE = 100_000  # Rows parsed at a time when loading pattern counts
+CSV_DTYPES = {'pattern': 'string', 'count': 'int32'}
+
 class GraphBuilder:
     def __init__(self):
         self.graph = nx.Graph()
+        # Node labels and their counts as parallel arrays, for vectorized filtering
+        self._node_labels = np.empty(0, dtype=object)
+        self._counts = np.empty(0)
+        self._indexed_graph = None  # Graph the arrays were built from
+        self._layouts = None  # Visualizer that computes and caches export layouts, created on first export
 
     def build_graph(self, pattern_counts: Dict[str, int], title: str = "Pattern Frequency Graph") -> None:
         """Build a graph from pattern counts."""
         logger.info("Building graph from pattern counts.")
 
-        # Adding nodes with default coordinates (0,0) if not specified
-        for pattern, count in pattern_counts.items():
-            self.graph.add_node(pattern, count=count, x=0, y=0)  # Assign default x and y
-            logger.debug(f"Added node: {pattern} with count: {count}")
+        # Adding nodes with default coordinates (0,0) if not specified, in one bulk call
+        self.graph.add_nodes_from([(pattern, {'count': count, 'x': 0, 'y': 0})
+                                   for pattern, count in pattern_counts.items()])
+        logger.debug("Added %d nodes.", len(pattern_counts))
 
         # Connect nodes based on counts (for example purposes, simply connect adjacent)
         patterns = list(pattern_counts.keys())
-        for i in range(len(patterns) - 1):
-            self.graph.add_edge(patterns[i], patterns[i + 1])
+        self.graph.add_edges_from(list(zip(patterns, patterns[1:])))
+        self.index_counts()
 
         self.plot_graph(title)
 
     def plot_graph(self, title: str) -> None:
         """Plot the built graph using NetworkX and Plotly."""
         logger.info("Plotting the graph.")
-        edge_x = []
-        edge_y = []
-
-        # Iterate through edges and construct edge coordinates
-        for edge in self.graph.edges():
-            # Safely get x and y, using default values if not present
-            x0 = self.graph.nodes[edge[0]].get('x', 0)
-            y0 = self.graph.nodes[edge[0]].get('y', 0)
-            x1 = self.graph.nodes[edge[1]].get('x', 0)
-            y1 = self.graph.nodes[edge[1]].get('y', 0)
-
-            edge_x.extend([x0, x1, None])
-            edge_y.extend([y0, y1, None])
-
-        node_x = []
-        node_y = []
-        node_text = []
-
-        # Prepare node data for plotting
-        for node in self.graph.nodes():
-            x = self.graph.nodes[node].get('x', 0)  # Default to 0 if missing
-            y = self.graph.nodes[node].get('y', 0)  # Default to 0 if missing
-            node_x.append(x)
-            node_y.append(y)
-            node_text.append(f"{node}: {self.graph.nodes[node]['count']}")
-
-        # Create Plotly figure
+        self.build_figure(title).show()
+
+    def build_figure(self, title: str, pos: dict = None) -> go.Figure:
+        """Build the Plotly figure of the graph, positioning nodes by pos or by their x and y attributes."""
+        # Node coordinates in two arrays indexed by node position, missing values defaulting to 0
+        nodes = list(self.graph.nodes(data=True))
+        index = {node: i for i, (node, _) in enumerate(nodes)}
+        if pos is not None:
+            node_x = np.fromiter((pos[node][0] for node, _ in nodes), dtype=float, count=len(nodes))
+            node_y = np.fromiter((pos[node][1] for node, _ in nodes), dtype=float, count=len(nodes))
+        else:
+            node_x = np.fromiter((data.get('x', 0) for _, data in nodes), dtype=float, count=len(nodes))
+            node_y = np.fromiter((data.get('y', 0) for _, data in nodes), dtype=float, count=len(nodes))
+        node_text = [f"{node}: {data['count']}" for node, data in nodes]
+
+        # Each edge becomes x0, x1, NaN; Plotly breaks the line at NaN
+        edges = np.fromiter(map(index.__getitem__, chain.from_iterable(self.graph.edges())), dtype=np.intp).reshape(-1, 2)
+        edge_x = np.full(len(edges) * 3, np.nan)
+        edge_y = np.full(len(edges) * 3, np.nan)
+        edge_x[0::3] = node_x[edges[:, 0]]
+        edge_x[1::3] = node_x[edges[:, 1]]
+        edge_y[0::3] = node_y[edges[:, 0]]
+        edge_y[1::3] = node_y[edges[:, 1]]
+
+        # Create Plotly figure; WebGL traces show node labels on hover only
+        scatter = scatter_cls(len(edge_x) + len(node_x))
         fig = go.Figure()
-        fig.add_trace(go.Scatter(x=edge_x, y=edge_y, line=dict(width=0.5, color='black'), hoverinfo='none', mode='lines'))
-        fig.add_trace(go.Scatter(x=node_x, y=node_y, mode='markers+text', text=node_text, textposition="top center",
-                                 marker=dict(showscale=True, colorscale='YlGnBu', size=10, color=node_y,
-                                             colorbar=dict(thickness=15, title='Node Count', xanchor='left', titleside='right'))))
+        fig.add_trace(scatter(x=edge_x, y=edge_y, line=dict(width=0.5, color='black'), hoverinfo='none', mode='lines'))
+        fig.add_trace(scatter(x=node_x, y=node_y, mode='markers+text' if scatter is go.Scatter else 'markers',
+                              text=node_text, textposition="top center",
+                              marker=dict(showscale=True, colorscale='YlGnBu', size=10, color=node_y,
+                                          colorbar=dict(thickness=15, title='Node Count', xanchor='left', titleside='right'))))
 
         fig.update_layout(title=title, showlegend=False, hovermode='closest', margin=dict(l=0, r=0, t=40, b=0))
-        fig.show()
+        return fig
 
     def export_graph(self, filename: str, format: str = 'png') -> None:
         """Export the current graph to a file in specified format."""
-        logger.info(f"Exporting graph to {filename}.{format}")
-        # Save the graph using NetworkX
+        logger.info("Exporting graph to %s.%s", filename, format)
         if format not in ['png', 'svg', 'pdf', 'html']:
             logger.error("Unsupported format. Please use 'png', 'svg', 'pdf', or 'html'.")
             return
 
-        # Here you could add actual saving code for different formats
+        # Nodes are placed by a spring layout, cached per graph so repeated exports lay it out once
         try:
-            import matplotlib.pyplot as plt  # Make sure matplotlib is imported for exporting
-            plt.figure(figsize=(12, 8))
-            pos = nx.spring_layout(self.graph)
-            nx.draw(self.graph, pos, with_labels=True, node_color='skyblue', node_size=2000, font_size=15)
-            plt.title("Exported Pattern Frequency Graph")
-            plt.axis('off')
-            plt.savefig(f"{filename}.{format}", format=format)
-            plt.close()
-            logger.info(f"Graph exported successfully to {filename}.{format}")
+            if self._layouts is None:
+                self._layouts = Visualizer()
+            if self._layouts.graph is not self.graph:
+                self._layouts.set_graph(self.graph)
+            pos = self._layouts.get_layout('spring')
+            fig = self.build_figure("Exported Pattern Frequency Graph", pos)
+            if format == 'html':
+                fig.write_html(f"{filename}.{format}")
+            else:
+                fig.write_image(f"{filename}.{format}", format=format)  # Static images are rendered by kaleido
+            logger.info("Graph exported successfully to %s.%s", filename, format)
         except Exception as e:
-            logger.error(f"Error exporting graph: {e}")
+            logger.error("Error exporting graph: %s", e)
 
     def dynamic_legend(self, pattern_counts: Dict[str, int]) -> None:
         """Create a dynamic legend showing counts of each pattern."""
@@ -98,31 +110,47 @@ class GraphBuilder:
 
     def filter_nodes_by_range(self, min_count: int, max_count: int) -> List[str]:
         """Filter nodes based on a count range."""
-        logger.info(f"Filtering nodes with count between {min_count} and {max_count}.")
-        filtered_nodes = [node for node in self.graph.nodes if min_count <= self.graph.nodes[node]['count'] <= max_count]
-        logger.info(f"Filtered nodes: {filtered_nodes}")
+        logger.info("Filtering nodes with count between %s and %s.", min_count, max_count)
+        # The graph may have been replaced or changed since build_graph indexed it
+        if self._indexed_graph is not self.graph or len(self._counts) != self.graph.number_of_nodes():
+            self.index_counts()
+        mask = (self._counts >= min_count) & (self._counts <= max_count)
+        filtered_nodes = self._node_labels[mask].tolist()
+        logger.info("Filtered nodes: %s", filtered_nodes)
         return filtered_nodes
 
+    def index_counts(self) -> None:
+        """Copy node labels and counts into NumPy arrays."""
+        nodes = self.graph.nodes(data='count')
+        self._node_labels = np.fromiter((node for node, _ in nodes), dtype=object, count=len(nodes))
+        self._counts = np.fromiter((count for _, count in nodes), dtype=float, count=len(nodes))
+        self._indexed_graph = self.graph
+
     def load_data_from_csv(self, filepath: str) -> Dict[str, int]:
         """Load pattern counts from a CSV file."""
-        logger.info(f"Loading pattern counts from {filepath}.")
+        logger.info("Loading pattern counts from %s.", filepath)
         if not os.path.exists(filepath):
             logger.error("File does not exist.")
             return {}
 
         try:
-            df = pd.read_csv(filepath)
-            if 'pattern' not in df.columns or 'count' not in df.columns:
-                logger.error("CSV must contain 'pattern' and 'count' columns.")
-                return {}
-            pattern_counts = dict(zip(df['pattern'], df['count']))
+            # Only the two needed columns are parsed, with narrow types, a chunk at a time
+            pattern_counts = {}
+            with pd.read_csv(filepath, usecols=['pattern', 'count'], dtype=CSV_DTYPES,
+                             chunksize=CSV_CHUNK_SIZE) as reader:
+                for chunk in reader:
+                    pattern_counts.update(zip(chunk['pattern'], chunk['count']))
             logger.info("Data loaded successfully.")
             return pattern_counts
+        except ValueError as e:
+            # Raised by usecols when a column is missing, and by dtype when a count is not an integer
+            logger.error("CSV must contain 'pattern' and integer 'count' columns: %s", e)
+            return {}
         except Exception as e:
-            logger.error(f"Error loading CSV data: {e}")
+            logger.error("Error loading CSV data: %s", e)
             return {}
 
-if __name__ == "__main__":
+def main():
     # Example usage
     pattern_counts = {
         'malicious_string_1': 5,
@@ -136,3 +164,6 @@ if __name__ == "__main__":
     graph_builder.dynamic_legend(pattern_counts)
     filtered_nodes = graph_builder.filter_nodes_by_range(3, 5)
     print("Filtered Nodes:", filtered_nodes)
+
+if __name__ == "__main__":
+    main()
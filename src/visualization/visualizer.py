@@ -1,70 +1,286 @@
 import plotly.graph_objects as go
 import networkx as nx
 from networkx.algorithms import community
+import numpy as np
 import pandas as pd
 import logging
+from itertools import chain
+
+try:
+    from scipy.optimize import minimize  # Optional: quasi-Newton layout for large graphs
+except ImportError:
+    minimize = None
+
+try:
+    import igraph  # Optional: C implementation of Louvain (multilevel) community detection
+except ImportError:
+    igraph = None
+
+try:
+    from fa2_modified import ForceAtlas2  # Optional: Barnes-Hut force-directed layout
+except ImportError:
+    ForceAtlas2 = None
 
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Above this many nodes the spring layout runs on NumPy arrays instead of nx.spring_layout
+NUMPY_LAYOUT_MIN_NODES = 100
+# Above this many nodes, and with SciPy available, the layout minimizes the spring energy with L-BFGS
+LBFGS_LAYOUT_MIN_NODES = 500
+# Above this many nodes, repulsion is approximated with Barnes-Hut (ForceAtlas2) instead of computed per pair
+BARNES_HUT_MIN_NODES = 2000
+BARNES_HUT_THETA = 0.9
+FORCEATLAS2_ITERATIONS = 100
+# Above this many plotted points (edge endpoints and nodes), traces render with WebGL instead of SVG
+WEBGL_MIN_POINTS = 5000
+# Spring iterations used to settle the nodes around a small change to the graph
+UPDATE_LAYOUT_ITERATIONS = 10
+# Rows written at a time when exporting to CSV
+CSV_CHUNK_SIZE = 100_000
+# Above this many nodes, communities are found with igraph when it is installed
+LOUVAIN_BACKEND_MIN_NODES = 1000
+# Larger graphs are rendered as one point per community
+MAX_RENDER_NODES = 10_000
+# Pairwise distances are computed for this many node pairs at a time to bound memory
+LAYOUT_BLOCK_PAIRS = 4_000_000
+
+def scatter_cls(point_count: int) -> type:
+    """Scatter trace type for a figure plotting this many points: WebGL when SVG would be slow."""
+    return go.Scattergl if point_count > WEBGL_MIN_POINTS else go.Scatter
+
+def edge_array(graph: nx.Graph, index: dict, dtype=np.intp) -> np.ndarray:
+    """Edges as an (m, 2) array of node positions, mapped in one pass without per-edge tuples."""
+    return np.fromiter(map(index.__getitem__, chain.from_iterable(graph.edges())), dtype=dtype).reshape(-1, 2)
+
+def fruchterman_reingold_layout(graph: nx.Graph, iterations: int = 50, seed: int = None) -> dict:
+    """Force-directed layout on contiguous float32 coordinate arrays instead of per-node tuples."""
+    nodes = list(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = edge_array(graph, index)
+    edges = edges[edges[:, 0] != edges[:, 1]]  # Self-loops exert no force
+    src, dst = edges[:, 0], edges[:, 1]
+
+    rng = np.random.default_rng(seed)
+    xs = rng.random(n, dtype=np.float32)
+    ys = rng.random(n, dtype=np.float32)
+    k_sq = np.float32(1.0 / n)
+    k = np.sqrt(k_sq)
+    temperature = 0.1 * float(max(np.ptp(xs), np.ptp(ys), 1e-6))
+    cooling = temperature / (iterations + 1)
+    block = max(1, LAYOUT_BLOCK_PAIRS // n)
+    disp_x = np.empty(n, dtype=np.float32)
+    disp_y = np.empty(n, dtype=np.float32)
+
+    for _ in range(iterations):
+        # Repulsion between every pair of nodes, k^2 / d, a block of rows at a time
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            dx = xs[start:stop, None] - xs[None, :]
+            dy = ys[start:stop, None] - ys[None, :]
+            force = dx * dx
+            force += dy * dy
+            np.maximum(force, np.float32(1e-4), out=force)
+            np.divide(k_sq, force, out=force)
+            disp_x[start:stop] = np.einsum('ij,ij->i', dx, force)
+            disp_y[start:stop] = np.einsum('ij,ij->i', dy, force)
+        # Attraction along edges, d^2 / k
+        if len(edges):
+            dx = xs[src] - xs[dst]
+            dy = ys[src] - ys[dst]
+            pull = np.sqrt(dx * dx + dy * dy) / k
+            dx *= pull
+            dy *= pull
+            np.subtract.at(disp_x, src, dx)
+            np.add.at(disp_x, dst, dx)
+            np.subtract.at(disp_y, src, dy)
+            np.add.at(disp_y, dst, dy)
+        # Move each node by at most the current temperature
+        length = np.sqrt(disp_x * disp_x + disp_y * disp_y)
+        length[length < 0.01] = 0.1
+        scale = np.float32(temperature) / length
+        step_x = disp_x * scale
+        step_y = disp_y * scale
+        xs += step_x
+        ys += step_y
+        temperature -= cooling
+        if np.sqrt(np.sum(step_x * step_x + step_y * step_y)) / n < 1e-4:
+            break
+
+    pos = nx.rescale_layout(np.column_stack((xs, ys)).astype(np.float64), scale=1)
+    return dict(zip(nodes, pos))
+
+def lbfgs_layout(graph: nx.Graph, maxiter: int = 200, seed: int = None) -> dict:
+    """Force-directed layout found by minimizing the Fruchterman-Reingold energy with L-BFGS."""
+    nodes = list(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = edge_array(graph, index)
+    edges = edges[edges[:, 0] != edges[:, 1]]  # Self-loops exert no force
+    src, dst = edges[:, 0], edges[:, 1]
+    k = np.sqrt(1.0 / n)
+    block = max(1, LAYOUT_BLOCK_PAIRS // n)
+
+    def energy(flat):
+        # Attraction d^3 / 3k along edges and repulsion -k^2 log d between all pairs; their
+        # gradients are exactly the Fruchterman-Reingold forces
+        xs, ys = flat[:n], flat[n:]
+        grad_x = np.zeros(n)
+        grad_y = np.zeros(n)
+        total = 0.0
+        for start in range(0, n, block):
+            stop = min(start + block, n)
+            dx = xs[start:stop, None] - xs[None, :]
+            dy = ys[start:stop, None] - ys[None, :]
+            d_sq = dx * dx + dy * dy
+            d_sq[np.arange(stop - start), np.arange(start, stop)] = 1.0  # No self-repulsion
+            np.maximum(d_sq, 1e-9, out=d_sq)
+            total -= 0.25 * k * k * np.log(d_sq).sum()  # Each pair is seen twice; log d = log(d^2) / 2
+            np.divide(k * k, d_sq, out=d_sq)
+            grad_x[start:stop] -= np.einsum('ij,ij->i', dx, d_sq)
+            grad_y[start:stop] -= np.einsum('ij,ij->i', dy, d_sq)
+        if len(edges):
+            dx = xs[src] - xs[dst]
+            dy = ys[src] - ys[dst]
+            dist = np.sqrt(dx * dx + dy * dy)
+            total += (dist ** 3).sum() / (3 * k)
+            pull = dist / k
+            np.add.at(grad_x, src, dx * pull)
+            np.subtract.at(grad_x, dst, dx * pull)
+            np.add.at(grad_y, src, dy * pull)
+            np.subtract.at(grad_y, dst, dy * pull)
+        return total, np.concatenate((grad_x, grad_y))
+
+    rng = np.random.default_rng(seed)
+    result = minimize(energy, rng.random(2 * n), jac=True, method='L-BFGS-B', options={'maxiter': maxiter})
+    pos = nx.rescale_layout(np.column_stack((result.x[:n], result.x[n:])), scale=1)
+    return dict(zip(nodes, pos))
+
+class _SoAGraph:
+    """Node attributes and edges of a graph as parallel arrays, for plotting without per-node dicts."""
+
+    def __init__(self, graph: nx.Graph):
+        data = graph.nodes.values()
+        self.nodes = list(graph)
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        n = len(self.nodes)
+        self.counts = np.fromiter((d.get('count', 0) for d in data), dtype=np.int32, count=n)
+        # Node types as integer codes into type_names, in the narrowest unsigned type that holds them all
+        codes, names = pd.factorize(np.fromiter((d.get('type') for d in data), dtype=object, count=n),
+                                    use_na_sentinel=False)
+        self.types = codes.astype(np.min_scalar_type(max(len(names) - 1, 0)))
+        self.type_names = names
+        edges = edge_array(graph, self.node_index, dtype=np.int32)
+        self.edge_src = edges[:, 0].copy()
+        self.edge_dst = edges[:, 1].copy()
+        # Node colors by type, copied per plot so the highlighted node can be recolored
+        self.base_colors = np.where(self.type_mask('malicious'), 'red', 'green').astype(object)
+
+    def type_mask(self, name: str) -> np.ndarray:
+        """Boolean mask of the nodes whose type is name."""
+        codes = np.flatnonzero(self.type_names == name)
+        return self.types == codes[0] if len(codes) else np.zeros(len(self.types), dtype=bool)
+
 class Visualizer:
     def __init__(self):
         self.graph = nx.Graph()
+        self.layout = "spring"
+        # (node count, edge count, layout) -> positions, for the current graph only
+        self._layout_cache = {}
+        self._spring_pos = None  # Last spring layout, used to warm-start the next one
+        self._soa = None  # Array form of self.graph, rebuilt when the graph changes
+        self._soa_key = None
 
     def set_graph(self, graph: nx.Graph) -> None:
         """Set the graph to be visualized."""
         self.graph = graph
+        self._layout_cache = {}
+        self._spring_pos = None
+        self._soa = None
         logger.info("Graph has been set for visualization.")
 
-    def visualize_graph(self, title: str = "Malware Signature Patterns", layout: str = "spring", highlight_node: str = None) -> None:
+    def update_graph(self, added_nodes=(), added_edges=(), removed_edges=()) -> None:
+        """Apply a small change to the graph, moving only the affected nodes of the spring layout."""
+        previous = self._spring_pos
+        self.graph.add_nodes_from(added_nodes)
+        self.graph.add_edges_from(added_edges)
+        self.graph.remove_edges_from(removed_edges)
+        self._layout_cache = {}
+        self._soa = None
+        if previous is None:
+            return  # No layout yet; the next one is computed from scratch
+
+        # Nodes that gained or lost an edge, or are new, move; every other node keeps its position
+        moved = {node for edge in (*added_edges, *removed_edges) for node in edge[:2]}
+        pos = {node: previous[node] for node in self.graph if node in previous}
+        rng = np.random.default_rng()
+        for node in self.graph:
+            if node not in pos:
+                # New nodes start at the centroid of their placed neighbours, slightly jittered so
+                # that nodes sharing a centroid can separate
+                placed = [pos[neighbor] for neighbor in self.graph[node] if neighbor in pos]
+                pos[node] = (np.mean(placed, axis=0) if placed else np.zeros(2)) + rng.normal(0, 0.01, 2)
+                moved.add(node)
+        fixed = [node for node in self.graph if node not in moved]
+        if len(fixed) < len(pos):
+            pos = nx.spring_layout(self.graph, pos=pos, fixed=fixed or None, iterations=UPDATE_LAYOUT_ITERATIONS)
+        self._spring_pos = pos
+        self._layout_cache[(*self.graph_size(), 'spring')] = pos
+        logger.info("Graph updated: %d nodes moved.", len(pos) - len(fixed))
+
+    def graph_size(self) -> tuple:
+        """Node and edge counts of the current graph."""
+        # Counted afresh each call so nodes and edges added in place are always noticed; counting
+        # edges walks the adjacency once, far cheaper than the layout it guards
+        return self.graph.number_of_nodes(), self.graph.number_of_edges()
+
+    @property
+    def soa(self) -> _SoAGraph:
+        """The current graph's nodes and edges as parallel arrays."""
+        # Same change signature as the layout cache, plus identity in case the graph was replaced
+        key = (id(self.graph), *self.graph_size())
+        if self._soa is None or self._soa_key != key:
+            self._soa = _SoAGraph(self.graph)
+            self._soa_key = key
+        return self._soa
+
+    def set_graph_layout(self, layout: str) -> None:
+        """Select the default layout; its positions come from the layout cache."""
+        self.layout = layout
+
+    def visualize_graph(self, title: str = "Malware Signature Patterns", layout: str = None, highlight_node: str = None) -> None:
         """Visualize the graph with customizable layouts and interactive tooltips."""
         logger.info("Visualizing the graph.")
-        pos = self.get_layout(layout)
-
-        # Extract edge positions for Plotly
-        edge_x = []
-        edge_y = []
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.append(x0)
-            edge_x.append(x1)
-            edge_x.append(None)  # Break line
-            edge_y.append(y0)
-            edge_y.append(y1)
-            edge_y.append(None)  # Break line
-
-        # Extract node positions and text for Plotly
-        node_x = []
-        node_y = []
-        node_text = []
-        colors = []
-        for node in self.graph.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            count = self.graph.nodes[node]['count']
-            node_type = self.graph.nodes[node]['type']
-            node_text.append(f"{node}<br>Type: {node_type}<br>Count: {count}")
-
-            # Determine color based on type
-            colors.append('red' if node_type == 'malicious' else 'green')
-
-            # Highlight selected node
-            if highlight_node and node == highlight_node:
-                colors[-1] = 'blue'  # Highlight color
-
-        # Create Plotly figure
+        pos = self.get_layout(layout or self.layout)
+
+        # Extract node and edge positions and node text for Plotly
+        node_x, node_y, edge_x, edge_y = self.plot_coordinates(pos)
+        soa = self.soa
+        node_text = [f"{node}<br>Type: {node_type}<br>Count: {count}" for node, node_type, count
+                     in zip(soa.nodes, soa.type_names[soa.types], soa.counts.tolist())]
+
+        # Determine color based on type, then highlight the selected node
+        colors = soa.base_colors.copy()
+        if highlight_node and highlight_node in soa.node_index:
+            colors[soa.node_index[highlight_node]] = 'blue'  # Highlight color
+
+        # Create Plotly figure; WebGL traces show node labels on hover only
+        scatter = scatter_cls(len(edge_x) + len(node_x))
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=edge_x, y=edge_y,
             line=dict(width=0.5, color='gray'),
             hoverinfo='none', mode='lines'))
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=node_x, y=node_y,
-            mode='markers+text',
+            mode='markers+text' if scatter is go.Scatter else 'markers',
             text=node_text,
             textposition="top center",
             marker=dict(size=10, color=colors, line=dict(width=2, color='black'))))
@@ -85,37 +301,112 @@ class Visualizer:
                           hovermode='closest', margin=dict(l=0, r=0, t=40, b=0))
         fig.show()
 
+    def plot_coordinates(self, pos: dict) -> tuple:
+        """Node x and y arrays in graph node order, and edge x and y arrays of x0, x1, NaN triples."""
+        soa = self.soa
+        node_x = np.empty(len(soa.nodes))
+        node_y = np.empty(len(soa.nodes))
+        for i, node in enumerate(soa.nodes):
+            node_x[i], node_y[i] = pos[node]
+
+        # Plotly breaks the line at NaN
+        edge_x = np.full(len(soa.edge_src) * 3, np.nan)
+        edge_y = np.full(len(soa.edge_src) * 3, np.nan)
+        edge_x[0::3] = node_x[soa.edge_src]
+        edge_x[1::3] = node_x[soa.edge_dst]
+        edge_y[0::3] = node_y[soa.edge_src]
+        edge_y[1::3] = node_y[soa.edge_dst]
+        return node_x, node_y, edge_x, edge_y
+
     def get_layout(self, layout: str) -> dict:
         """Get positions for nodes based on the specified layout."""
-        logger.info(f"Using layout: {layout}")
-        if layout == 'spring':
-            return nx.spring_layout(self.graph)
-        elif layout == 'circular':
-            return nx.circular_layout(self.graph)
-        elif layout == 'hierarchical':
-            return nx.multipartite_layout(self.graph)
-        else:
+        logger.info("Using layout: %s", layout)
+        if layout not in ('spring', 'circular', 'hierarchical', 'forceatlas2'):
             logger.error("Invalid layout specified, defaulting to spring layout.")
-            return nx.spring_layout(self.graph)
+            layout = 'spring'
+        # Graphs are changed by adding or removing nodes and edges, so the counts are a cheap
+        # signature of whether a cached layout still applies
+        key = (*self.graph_size(), layout)
+        pos = self._layout_cache.get(key)
+        if pos is None:
+            if layout == 'spring':
+                pos = self.spring_layout()
+            elif layout == 'forceatlas2':
+                pos = self.forceatlas2_layout()
+            elif layout == 'circular':
+                pos = nx.circular_layout(self.graph)
+            else:
+                pos = self.hierarchical_layout()
+            self._layout_cache[key] = pos
+        return pos
+
+    def spring_layout(self) -> dict:
+        """Compute a spring layout, vectorized with NumPy (and optimized with L-BFGS) for larger graphs."""
+        if ForceAtlas2 is not None and self.graph.number_of_nodes() > BARNES_HUT_MIN_NODES:
+            return self.forceatlas2_layout()
+        if minimize is not None and self.graph.number_of_nodes() > LBFGS_LAYOUT_MIN_NODES:
+            pos = lbfgs_layout(self.graph)
+        elif self.graph.number_of_nodes() > NUMPY_LAYOUT_MIN_NODES:
+            pos = fruchterman_reingold_layout(self.graph)
+        else:
+            # Nodes kept from the previous layout start where they were, so it settles sooner
+            previous = self._spring_pos
+            if previous is not None:
+                previous = {node: xy for node, xy in previous.items() if node in self.graph}
+            pos = nx.spring_layout(self.graph, pos=previous or None)
+        self._spring_pos = pos
+        return pos
+
+    def hierarchical_layout(self) -> dict:
+        """Lay nodes out in vertical layers by type, or by count quintile when some node has no type."""
+        soa = self.soa
+        if not soa.nodes:
+            return {}
+        if not pd.isna(soa.type_names).any():
+            return nx.multipartite_layout(self.graph, subset_key='type', align='vertical')
+        # Layer 0-4 by which fifth of the count distribution each node falls in
+        layers = np.digitize(soa.counts, np.quantile(soa.counts, np.linspace(0, 1, 6))[1:-1])
+        layered = nx.Graph()
+        layered.add_nodes_from(zip(soa.nodes, ({'layer': layer} for layer in layers.tolist())))
+        return nx.multipartite_layout(layered, subset_key='layer', align='vertical')
+
+    def forceatlas2_layout(self) -> dict:
+        """Compute a ForceAtlas2 layout, approximating repulsion with a Barnes-Hut quadtree."""
+        if ForceAtlas2 is None:
+            logger.warning("fa2_modified is not installed, using the spring layout instead.")
+            return self.spring_layout()
+        forceatlas2 = ForceAtlas2(barnesHutOptimize=True, barnesHutTheta=BARNES_HUT_THETA, verbose=False)
+        # Nodes kept from the previous layout start where they were, so it settles sooner
+        previous = self._spring_pos
+        if previous is not None:
+            previous = {node: tuple(previous[node]) if node in previous else tuple(np.random.random(2))
+                        for node in self.graph}
+        pos = forceatlas2.forceatlas2_networkx_layout(self.graph, pos=previous,
+                                                      iterations=FORCEATLAS2_ITERATIONS)
+        # ForceAtlas2 coordinates are unbounded; scale them to the [-1, 1] box the other layouts use
+        pos = nx.rescale_layout_dict(pos, scale=1)
+        self._spring_pos = pos
+        return pos
 
     def export_to_csv(self, filename: str) -> None:
         """Export the graph data to a CSV file."""
-        logger.info(f"Exporting graph data to {filename}.csv")
-        node_data = [(node, self.graph.nodes[node]['count'], self.graph.nodes[node]['type']) for node in self.graph.nodes()]
-        edge_data = [(edge[0], edge[1]) for edge in self.graph.edges()]
+        logger.info("Exporting graph data to %s.csv", filename)
+        soa = self.soa
+        labels = np.fromiter(soa.nodes, dtype=object, count=len(soa.nodes))
 
-        # Create DataFrames
-        nodes_df = pd.DataFrame(node_data, columns=['Node', 'Count', 'Type'])
-        edges_df = pd.DataFrame(edge_data, columns=['Source', 'Target'])
+        # Create DataFrames from typed columns: int32 counts and categorical types
+        nodes_df = pd.DataFrame({'Node': labels, 'Count': soa.counts,
+                                 'Type': pd.Categorical(soa.type_names[soa.types])})
+        edges_df = pd.DataFrame({'Source': labels[soa.edge_src], 'Target': labels[soa.edge_dst]})
 
-        # Save to CSV
-        nodes_df.to_csv(f"{filename}_nodes.csv", index=False)
-        edges_df.to_csv(f"{filename}_edges.csv", index=False)
+        # Save to CSV, a chunk of rows at a time
+        nodes_df.to_csv(f"{filename}_nodes.csv", index=False, chunksize=CSV_CHUNK_SIZE)
+        edges_df.to_csv(f"{filename}_edges.csv", index=False, chunksize=CSV_CHUNK_SIZE)
         logger.info("Export completed.")
 
     def highlight_connections(self, node: str) -> None:
         """Highlight connections for a specific node."""
-        logger.info(f"Highlighting connections for node: {node}")
+        logger.info("Highlighting connections for node: %s", node)
         if node in self.graph.nodes():
             connected_nodes = list(self.graph.neighbors(node))
             return connected_nodes
@@ -126,54 +417,99 @@ class Visualizer:
     def cluster_nodes(self) -> None:
         """Cluster nodes using the Louvain method and visualize."""
         logger.info("Clustering nodes using the Louvain method.")
-        partition = community.louvain_communities(self.graph)
-        colors = {}
-        for i, comm in enumerate(partition):
-            for node in comm:
-                colors[node] = f'rgba({i*50 % 255}, {i*100 % 255}, {i*200 % 255}, 0.6)'
-
-        pos = nx.spring_layout(self.graph)
-        edge_x = []
-        edge_y = []
-        for edge in self.graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_x.append(x0)
-            edge_x.append(x1)
-            edge_x.append(None)  # Break line
-            edge_y.append(y0)
-            edge_y.append(y1)
-            edge_y.append(None)  # Break line
-
-        node_x = []
-        node_y = []
-        node_text = []
-        for node in self.graph.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-            count = self.graph.nodes[node]['count']
-            node_text.append(f"{node}<br>Count: {count}")
+        soa = self.soa
+        cluster_of, n_communities = self.community_ids()
+
+        pos = self.get_layout('spring')
+        node_x, node_y, edge_x, edge_y = self.plot_coordinates(pos)
+        node_text = [f"{node}<br>Count: {count}" for node, count in zip(soa.nodes, soa.counts.tolist())]
 
+        # One edge trace and one node trace however many communities there are: nodes are
+        # colored by community id through a colorscale rather than a trace per community
+        scatter = scatter_cls(len(edge_x) + len(node_x))
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=edge_x, y=edge_y,
             line=dict(width=0.5, color='gray'),
             hoverinfo='none', mode='lines'))
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=node_x, y=node_y,
-            mode='markers+text',
+            mode='markers+text' if scatter is go.Scatter else 'markers',
             text=node_text,
             textposition="top center",
-            marker=dict(size=10, color=[colors[node] for node in self.graph.nodes()],
+            marker=dict(size=10, color=cluster_of,
+                        colorscale='Turbo', cmin=0, cmax=max(n_communities - 1, 1), opacity=0.6,
+                        showscale=True, colorbar=dict(title=dict(text='Community')),
                         line=dict(width=2, color='black'))))
 
         fig.update_layout(title="Clustered Malware Signature Patterns", showlegend=False,
                           hovermode='closest', margin=dict(l=0, r=0, t=40, b=0))
         fig.show()
 
-if __name__ == "__main__":
+    def community_ids(self) -> tuple:
+        """Louvain community id of every node, in graph node order, and the number of communities."""
+        soa = self.soa
+        if igraph is not None and len(soa.nodes) > LOUVAIN_BACKEND_MIN_NODES:
+            # igraph vertex i is node i of the array snapshot, so memberships come back in node order
+            edges = np.column_stack((soa.edge_src, soa.edge_dst)).tolist()
+            clustering = igraph.Graph(n=len(soa.nodes), edges=edges).community_multilevel()
+            return np.asarray(clustering.membership, dtype=np.intp), len(clustering)
+        partition = community.louvain_communities(self.graph)
+        cluster_of = np.empty(len(soa.nodes), dtype=np.intp)
+        for i, comm in enumerate(partition):
+            cluster_of[[soa.node_index[node] for node in comm]] = i
+        return cluster_of, len(partition)
+
+    def render(self, title: str = "Malware Signature Patterns", max_nodes: int = MAX_RENDER_NODES) -> None:
+        """Visualize the graph, or one point per community when it has more than max_nodes nodes."""
+        if self.graph_size()[0] <= max_nodes:
+            self.visualize_graph(title)
+            return
+        logger.info("Graph too large to plot node by node; rendering its communities.")
+        soa = self.soa
+        cluster_of, n_communities = self.community_ids()
+        sizes = np.bincount(cluster_of, minlength=n_communities)
+        totals = np.bincount(cluster_of, weights=soa.counts, minlength=n_communities).astype(np.int64)
+
+        # Edges between different communities become one edge between their supernodes
+        pairs = np.sort(np.column_stack((cluster_of[soa.edge_src], cluster_of[soa.edge_dst])), axis=1)
+        pairs = np.unique(pairs[pairs[:, 0] != pairs[:, 1]], axis=0)
+        summary = nx.Graph()
+        summary.add_nodes_from(range(n_communities))
+        summary.add_edges_from(pairs.tolist())
+        pos = nx.spring_layout(summary, seed=0)
+        comm_x = np.array([pos[i][0] for i in range(n_communities)])
+        comm_y = np.array([pos[i][1] for i in range(n_communities)])
+        edge_x = np.full(len(pairs) * 3, np.nan)
+        edge_y = np.full(len(pairs) * 3, np.nan)
+        edge_x[0::3], edge_x[1::3] = comm_x[pairs[:, 0]], comm_x[pairs[:, 1]]
+        edge_y[0::3], edge_y[1::3] = comm_y[pairs[:, 0]], comm_y[pairs[:, 1]]
+
+        # Hover text lists each community's highest-count members for drilling down
+        order = np.lexsort((-soa.counts, cluster_of))
+        starts = np.searchsorted(cluster_of[order], np.arange(n_communities))
+        text = [f"Community {i}<br>Nodes: {sizes[i]}<br>Total count: {totals[i]}<br>Top: "
+                + ", ".join(str(soa.nodes[j]) for j in order[start:start + min(3, sizes[i])])
+                for i, start in enumerate(starts)]
+
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=edge_x, y=edge_y,
+            line=dict(width=0.5, color='gray'),
+            hoverinfo='none', mode='lines'))
+        fig.add_trace(go.Scatter(
+            x=comm_x, y=comm_y,
+            mode='markers',
+            text=text,
+            marker=dict(size=np.clip(np.sqrt(sizes), 5, 60), color=totals, colorscale='YlGnBu',
+                        showscale=True, colorbar=dict(title=dict(text='Total count')),
+                        line=dict(width=1, color='black'))))
+        fig.update_layout(title=f"{title} ({n_communities} communities)", showlegend=False,
+                          hovermode='closest', margin=dict(l=0, r=0, t=40, b=0))
+        fig.show()
+
+def main():
     # Example usage
     graph = nx.Graph()
     graph.add_nodes_from([
@@ -196,7 +532,10 @@ if __name__ == "__main__":
     
     # Example to highlight connections for a specific node
     connections = visualizer.highlight_connections('malicious_string_1')
-    logger.info(f"Connections for 'malicious_string_1': {connections}")
+    logger.info("Connections for 'malicious_string_1': %s", connections)
     
     # Example to export graph to CSV
     visualizer.export_to_csv("malware_graph")
+
+if __name__ == "__main__":
+    main()